@@ -9,8 +9,9 @@ from sqlalchemy import case, create_engine, func
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.arb.profit_persistence import load_recent_profitable, load_top_per_hour
-from src.db.models import Base, PaperTrade, RunMetadata, Status
-from src.db.runtime_status import ensure_runtime_status_row, ensure_status_row, update_runtime_status
+from src.db.models import PaperTrade, RunMetadata, Status
+from src.db.runtime_status import ensure_status_row, update_runtime_status
+from src.db.session import prepare_schema
 
 DB_PATH = os.getenv("DB_PATH", "data/arb_bot.sqlite")
 LOG_FILE_PATH = os.getenv("LOG_FILE_PATH", "data/bot.log")
@@ -18,9 +19,10 @@ LOG_FILE_PATH = os.getenv("LOG_FILE_PATH", "data/bot.log")
 engine = create_engine(f"sqlite:///{DB_PATH}")
 SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
 
-Base.metadata.create_all(engine)
+# Migrate before serving: an API started first on an older database would
+# otherwise read second timestamps as microseconds.
+prepare_schema(engine, "sqlite")
 with SessionLocal() as session:
-    ensure_runtime_status_row(session)
     ensure_status_row(session)
 
 app = FastAPI(title="Hyperliquid Arbitrage Bot API", openapi_url="/api/openapi.json")
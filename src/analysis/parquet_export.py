@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+
+from src.config.models import Settings
+from src.db.models import Opportunity, PaperTrade
+from src.db.session import get_session
+
+EXPORT_MODELS = {
+    Opportunity.__tablename__: Opportunity,
+    PaperTrade.__tablename__: PaperTrade,
+}
+
+# Snapshot JSON does not map onto a flat Arrow schema; keep it in the OLTP tables.
+_SKIPPED_COLUMNS = {"id", "parameters_snapshot"}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.dataset
+        import pyarrow.parquet
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError("Parquet export requires pyarrow (pip install .[parquet])") from exc
+    return pyarrow
+
+
+def _columns_for(model) -> List:
+    return [column for column in model.__table__.columns if column.name not in _SKIPPED_COLUMNS]
+
+
+def _fetch_columns(session, model, run_id: str) -> Dict[str, list]:
+    # Read plain rows via Core and transpose them, avoiding ORM object construction.
+    columns = _columns_for(model)
+    rows = session.execute(select(*columns).where(model.run_id == run_id)).all()
+    if not rows:
+        return {}
+    return {column.name: list(values) for column, values in zip(columns, zip(*rows))}
+
+
+def export_run_to_parquet(
+    run_id: str,
+    output_dir: str = "analysis_output/parquet",
+    settings: Optional[Settings] = None,
+    tables: Iterable[str] = tuple(EXPORT_MODELS),
+) -> Dict[str, int]:
+    """Write the rows of ``run_id`` to a Parquet dataset partitioned by run_id.
+
+    Returns the number of rows exported per table.
+    """
+    pa = _require_pyarrow()
+    session_factory = get_session(settings)
+    exported: Dict[str, int] = {}
+    with session_factory() as s:
+        for table_name in tables:
+            data = _fetch_columns(s, EXPORT_MODELS[table_name], run_id)
+            if not data:
+                exported[table_name] = 0
+                continue
+            table = pa.Table.from_pydict(data)
+            pa.parquet.write_to_dataset(
+                table,
+                root_path=str(Path(output_dir) / table_name),
+                partition_cols=["run_id"],
+                existing_data_behavior="delete_matching",
+            )
+            exported[table_name] = table.num_rows
+    return exported
+
+
+def load_parquet_run(table_name: str, run_id: str, output_dir: str = "analysis_output/parquet"):
+    """Load one run's exported rows as a DataFrame using partition pruning."""
+    pa = _require_pyarrow()
+    dataset = pa.dataset.dataset(
+        str(Path(output_dir) / table_name), format="parquet", partitioning="hive"
+    )
+    return dataset.to_table(filter=pa.dataset.field("run_id") == run_id).to_pandas()
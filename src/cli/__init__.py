@@ -8,11 +8,13 @@ from typing import Dict, List, Optional, Tuple
 
 import typer
 
+from src.analysis.parquet_export import export_run_to_parquet
 from src.analysis.report import generate_report
 from src.config.loader import load_config
+from src.core.event_loop import install_uvloop
 from src.core.logging import setup_logging, get_logger
 from src.db.session import get_session, init_db
-from src.db.runtime_status import get_runtime_status, update_runtime_status
+from src.db.runtime_status import RuntimeStatusWriter, get_runtime_status
 from src.hyperliquid_client.client import HyperliquidClient
 from src.arb.market_graph import MarketGraph
 from src.arb.orderbook_cache import OrderbookCache
@@ -51,6 +53,35 @@ def measure_latency(config_path: str = typer.Option("config/config.yaml")):
     asyncio.run(_measure())
 
 
+@app.command()
+def check_spot_ws_coin(
+    asset: str = typer.Option("PURR/USDC", help="Spot pair to verify (e.g. PURR/USDC)"),
+    wait_seconds: float = typer.Option(5.0, help="Seconds to wait for l2Book data"),
+    config_path: str = typer.Option("config/config.yaml", help="Path to config"),
+):
+    """
+    Quick helper to verify the resolved WS coin string for a spot pair and check l2Book delivery.
+    """
+    settings = load_config(config_path)
+    setup_logging(settings.logging)
+
+    async def _run() -> None:
+        client = HyperliquidClient(settings.api, settings.network)
+        pair = asset.upper()
+        symbol_map = {client._normalize_spot_symbol(pair): pair}
+        await client.connect_ws()
+        await client.subscribe_orderbooks(symbol_map, kind="spot")
+        got_l2book = await client.wait_for_spot_l2book(pair, timeout=wait_seconds)
+        resolved = client.get_resolved_spot_coin(pair) or client.get_resolved_spot_coin(
+            client._normalize_spot_symbol(pair)
+        )
+        await client.close()
+        resolved_msg = resolved or "unknown"
+        typer.echo(f"[SPOT_WS] pair={pair} resolved_coin={resolved_msg} l2Book_received={got_l2book}")
+
+    asyncio.run(_run())
+
+
 def run_paper_bot_command(config_path: str = "config/config.yaml", run_id: Optional[str] = None):
     settings = load_config(config_path)
     setup_logging(settings.logging)
@@ -72,15 +103,16 @@ def run_paper_bot_command(config_path: str = "config/config.yaml", run_id: Optio
         session_factory = get_session(settings)
         profit_recorder = ProfitRecorder(db_session_factory=session_factory)
 
-        def _update_status(**fields):
-            with session_scope(session_factory) as s:
-                update_runtime_status(s, **fields)
+        status_writer = RuntimeStatusWriter(session_factory)
+
+        def _update_status(force: bool = False, **fields):
+            status_writer.update(force=force, **fields)
 
         def _get_status():
             with session_scope(session_factory) as s:
                 return get_runtime_status(s)
 
-        _update_status(bot_running=True, ws_connected=False, last_heartbeat=time.time())
+        _update_status(force=True, bot_running=True, ws_connected=False, last_heartbeat=time.time())
 
         stop_event = asyncio.Event()
 
@@ -232,12 +264,13 @@ def run_paper_bot_command(config_path: str = "config/config.yaml", run_id: Optio
             scanner.stop()
             trader.stop()
             await client.close()
-            _update_status(bot_running=False, ws_connected=False, last_heartbeat=time.time())
+            _update_status(force=True, bot_running=False, ws_connected=False, last_heartbeat=time.time())
             for task in tasks:
                 if not task.done():
                     task.cancel()
             await asyncio.gather(*tasks, return_exceptions=True)
 
+    install_uvloop()
     asyncio.run(_run())
 
 
@@ -256,5 +289,18 @@ def analyze_run(run_id: str = typer.Option(..., help="Run ID"), config_path: str
     typer.echo(f"Report written to {result['report_path']}, recommendations to {result['recommendations_path']}")
 
 
+@app.command()
+def export_parquet(
+    run_id: str = typer.Option(..., help="Run ID"),
+    config_path: str = typer.Option("config/config.yaml"),
+    output_dir: str = typer.Option("analysis_output/parquet"),
+):
+    settings = load_config(config_path)
+    setup_logging(settings.logging)
+    exported = export_run_to_parquet(run_id, output_dir, settings)
+    for table_name, count in exported.items():
+        typer.echo(f"{table_name}: {count} rows written to {output_dir}/{table_name}")
+
+
 if __name__ == "__main__":
     app()
@@ -9,6 +9,7 @@ from typing import Optional
 
 from src.config.loader import load_config
 from src.config.snapshot import safe_config_snapshot
+from src.core.event_loop import install_uvloop
 from src.core.logging import get_logger, setup_logging
 from src.db.run_metadata import create_run_metadata, update_run_metadata_end
 from src.db.session import get_session, init_db
@@ -170,6 +171,7 @@ def main(config_path: Optional[str] = "config/config.yaml") -> None:
         )
         return
 
+    install_uvloop()
     asyncio.run(
         _run_engine(
             args.config,
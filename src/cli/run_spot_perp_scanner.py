@@ -2,16 +2,13 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
 import logging
 from typing import Optional
 
-from src.cli.spot_perp_assets import select_auto_assets
 from src.config.loader import load_config
+from src.core.event_loop import install_uvloop
 from src.core.logging import get_logger, setup_logging
-from src.hyperliquid_client.client import HyperliquidClient
-from src.observability.feed_health import FeedHealthTracker
-from src.scanner.spot_perp_scanner import SpotPerpScanner
-from src.strategy.spot_perp_paper import SpotPerpPaperEngine
 
 logger = get_logger(__name__)
 
@@ -24,6 +21,14 @@ async def _run_scanner(
     once: bool,
     duration_seconds: Optional[int],
 ) -> None:
+    # Imported here so --help and argument errors skip the client, scanner and
+    # strategy import chain.
+    from src.cli.spot_perp_assets import select_auto_assets
+    from src.hyperliquid_client.client import HyperliquidClient
+    from src.observability.feed_health import FeedHealthTracker
+    from src.scanner.spot_perp_scanner import SpotPerpScanner
+    from src.strategy.spot_perp_paper import SpotPerpPaperEngine
+
     settings = load_config(config_path)
     setup_logging(settings.logging)
 
@@ -65,15 +70,24 @@ async def _run_scanner(
         logger.info("Spot-perp scanner stopped")
 
 
-def main(config_path: Optional[str] = "config/config.yaml") -> None:
-    parser = argparse.ArgumentParser(description="Run spot-perp edge scanner")
-    parser.add_argument("--config", default=config_path, help="Path to config YAML file")
+@functools.lru_cache(maxsize=None)
+def _build_parser(default_config: Optional[str]) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Run spot-perp edge scanner",
+        epilog="Runs on uvloop when it is installed (pip install .[speedups]).",
+    )
+    parser.add_argument("--config", default=default_config, help="Path to config YAML file")
     parser.add_argument("--assets", default=None, help="Comma-separated asset list")
     parser.add_argument("--auto-assets", action="store_true", help="Auto-select spot/perp assets")
     parser.add_argument("--auto-assets-n", type=int, default=15, help="Auto-assets limit")
     parser.add_argument("--once", action="store_true", help="Run a single scan cycle")
     parser.add_argument("--duration-seconds", type=int, default=None, help="Stop after N seconds")
-    args = parser.parse_args()
+    return parser
+
+
+def main(config_path: Optional[str] = "config/config.yaml") -> None:
+    args = _build_parser(config_path).parse_args()
+    install_uvloop()
 
     asyncio.run(
         _run_scanner(
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import sys
 from dataclasses import dataclass
 from math import inf
 from typing import Any, Dict, Iterable, List, Optional, Tuple
@@ -10,6 +12,12 @@ from src.hyperliquid_client.client import HyperliquidClient
 
 logger = get_logger(__name__)
 
+# assetCtxs field aliases, probed in priority order.
+_BID_KEYS = ("bidPx", "bestBid", "bid")
+_ASK_KEYS = ("askPx", "bestAsk", "ask")
+_MID_KEYS = ("midPx", "markPx")
+_VOLUME_KEYS = ("dayNtlVlm", "volume24h", "volume", "dayNotionalVolume")
+
 
 @dataclass(frozen=True)
 class AutoAssetCandidate:
@@ -18,6 +26,12 @@ class AutoAssetCandidate:
     volume_24h: Optional[float]
 
 
+def _upper_intern(value: Any) -> str:
+    # Symbols repeat across universe/tokens/assetCtxs; interning lets the
+    # set and dict lookups below compare by identity.
+    return sys.intern(str(value).upper())
+
+
 def _extract_meta_payload(raw: Any) -> Dict[str, Any]:
     if isinstance(raw, dict):
         return raw
@@ -38,7 +52,11 @@ def _spot_universe_and_tokens(spot_meta: Dict[str, Any]) -> Tuple[List[Dict[str,
     tokens = spot_meta.get("tokens") or []
     spot_meta_data = spot_meta.get("spotMeta")
     if isinstance(spot_meta_data, dict):
-        tokens = tokens + (spot_meta_data.get("tokens") or [])
+        nested_tokens = spot_meta_data.get("tokens")
+        if nested_tokens:
+            # Payloads normally carry tokens at one level only; reuse that
+            # list as-is and only merge when both levels are populated.
+            tokens = [*tokens, *nested_tokens] if tokens else nested_tokens
         universe = spot_meta_data.get("universe") or universe
     return universe, tokens
 
@@ -47,7 +65,7 @@ def _spot_base_symbols(spot_meta: Dict[str, Any]) -> set[str]:
     bases: set[str] = set()
     universe, tokens = _spot_universe_and_tokens(spot_meta)
     token_map = {
-        token.get("index"): str(token.get("name")).upper()
+        token.get("index"): _upper_intern(token.get("name"))
         for token in tokens
         if token.get("index") is not None and token.get("name")
     }
@@ -60,18 +78,18 @@ def _spot_base_symbols(spot_meta: Dict[str, Any]) -> set[str]:
         else:
             base = entry.get("base") or entry.get("coin") or entry.get("name") or entry.get("symbol")
         if base:
-            bases.add(str(base).upper())
+            bases.add(_upper_intern(base))
     return bases
 
 
 def is_spot_usdc_available(coin: str, spot_meta: Dict[str, Any]) -> bool:
     universe, tokens = _spot_universe_and_tokens(spot_meta)
     token_map = {
-        token.get("index"): str(token.get("name")).upper()
+        token.get("index"): _upper_intern(token.get("name"))
         for token in tokens
         if token.get("index") is not None and token.get("name")
     }
-    target = str(coin).upper()
+    target = _upper_intern(coin)
     candidates = {f"{target}/USDC", f"U{target}/USDC"}
 
     for entry in universe:
@@ -105,7 +123,7 @@ def _perp_base_symbols(perp_meta: Dict[str, Any]) -> set[str]:
             continue
         symbol = entry.get("name") or entry.get("symbol") or entry.get("coin") or entry.get("base")
         if symbol:
-            bases.add(str(symbol).upper())
+            bases.add(_upper_intern(symbol))
     return bases
 
 
@@ -116,37 +134,55 @@ def _asset_contexts(spot_meta: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
             continue
         coin = ctx.get("coin") or ctx.get("base") or ctx.get("name")
         if coin:
-            contexts[str(coin).upper()] = ctx
+            contexts[_upper_intern(coin)] = ctx
     return contexts
 
 
 def _parse_float(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
     try:
-        if value is None:
-            return None
         return float(value)
     except (TypeError, ValueError):
         return None
 
 
+def _first_float(ctx: Dict[str, Any], keys: Tuple[str, ...]) -> Optional[float]:
+    # Same as ctx.get(k1) or ctx.get(k2) or ...: the first truthy field wins,
+    # otherwise the last field's value is parsed.
+    value = None
+    for key in keys:
+        value = ctx.get(key)
+        if value:
+            break
+    return _parse_float(value)
+
+
 def _spread_proxy(ctx: Dict[str, Any]) -> Optional[float]:
-    bid = _parse_float(ctx.get("bidPx") or ctx.get("bestBid") or ctx.get("bid"))
-    ask = _parse_float(ctx.get("askPx") or ctx.get("bestAsk") or ctx.get("ask"))
+    bid = _first_float(ctx, _BID_KEYS)
+    ask = _first_float(ctx, _ASK_KEYS)
     if bid is None or ask is None or bid <= 0 or ask <= 0:
         return None
-    mid = _parse_float(ctx.get("midPx") or ctx.get("markPx"))
+    mid = _first_float(ctx, _MID_KEYS)
     if mid is None or mid <= 0:
         mid = (bid + ask) / 2
     return (ask - bid) / mid if mid else None
 
 
 def _volume_proxy(ctx: Dict[str, Any]) -> Optional[float]:
-    return _parse_float(
-        ctx.get("dayNtlVlm")
-        or ctx.get("volume24h")
-        or ctx.get("volume")
-        or ctx.get("dayNotionalVolume")
-    )
+    return _first_float(ctx, _VOLUME_KEYS)
+
+
+def _candidate_sort_key(item: AutoAssetCandidate) -> Tuple[bool, float, float]:
+    spread_missing = item.spread is None
+    spread_value = item.spread or 0.0
+    volume_value = item.volume_24h if item.volume_24h is not None else inf
+    return (spread_missing, -spread_value, volume_value)
 
 
 def select_auto_assets_from_meta(
@@ -163,6 +199,7 @@ def select_auto_assets_from_meta(
     perp_bases = _perp_base_symbols(perp_meta)
     all_symbols = sorted(spot_bases | perp_bases)
     candidates: List[str] = []
+    candidate_set: set[str] = set()
     for symbol in all_symbols:
         has_perp = symbol in perp_bases
         has_spot_usdc = is_spot_usdc_available(symbol, spot_meta)
@@ -173,6 +210,7 @@ def select_auto_assets_from_meta(
             logger.info("[AUTO_ASSETS][FILTER] drop=%s reason=missing_spot_usdc", symbol)
             continue
         candidates.append(symbol)
+        candidate_set.add(symbol)
 
     ctxs = _asset_contexts(spot_meta)
     ranked: List[AutoAssetCandidate] = []
@@ -189,21 +227,19 @@ def select_auto_assets_from_meta(
     has_spread = any(item.spread is not None for item in ranked)
     reason = "spread_desc_volume_asc" if has_spread else "volume_asc"
 
-    def sort_key(item: AutoAssetCandidate) -> Tuple[bool, float, float]:
-        spread_missing = item.spread is None
-        spread_value = item.spread or 0.0
-        volume_value = item.volume_24h if item.volume_24h is not None else inf
-        return (spread_missing, -spread_value, volume_value)
-
-    ranked.sort(key=sort_key)
+    ranked.sort(key=_candidate_sort_key)
     limit = max(limit, 1)
     selected = [item.symbol for item in ranked[:limit]]
+    selected_set = set(selected)
 
-    major = major_asset.upper()
-    if major in candidates and major not in selected:
+    major = _upper_intern(major_asset)
+    if major in candidate_set and major not in selected_set:
         if len(selected) >= limit:
-            selected = selected[: max(limit - 1, 0)]
+            keep = max(limit - 1, 0)
+            selected_set.difference_update(selected[keep:])
+            selected = selected[:keep]
         selected.append(major)
+        selected_set.add(major)
         reason = f"{reason};major={major}"
 
     return selected, reason
@@ -215,8 +251,14 @@ async def select_auto_assets(
     limit: int = 15,
     major_asset: str = "ETH",
 ) -> List[str]:
-    spot_meta = await client.fetch_spot_meta_and_asset_ctxs()
-    perp_meta = await client.fetch_perp_meta()
+    try:
+        spot_meta, perp_meta = await asyncio.gather(
+            client.fetch_spot_meta_and_asset_ctxs(),
+            client.fetch_perp_meta(),
+        )
+    except Exception as exc:
+        logger.warning("[AUTO_ASSETS] meta fetch failed: %s", exc)
+        raise
     selected, reason = select_auto_assets_from_meta(
         spot_meta,
         perp_meta,
@@ -21,10 +21,39 @@ from .models import (
 
 ENV_PREFIX = ""
 
+_dotenv_loaded = False
+
+_BOOL_STRINGS = {
+    "1": True,
+    "true": True,
+    "yes": True,
+    "on": True,
+    "0": False,
+    "false": False,
+    "no": False,
+    "off": False,
+}
+
+
+def _as_bool(value: Any) -> bool:
+    """Parse YAML bools/ints and env-var strings ("1", "yes", "on", ...)."""
+    if isinstance(value, str):
+        return _BOOL_STRINGS.get(value.strip().lower(), False)
+    return bool(value)
+
+
+def _ensure_dotenv_loaded() -> None:
+    # .env only seeds os.environ (existing variables win), so parsing it once
+    # per process is equivalent to parsing it on every load_config call.
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
 
 def load_config(config_path: str) -> Settings:
     """Load configuration from YAML and environment variables."""
-    load_dotenv()
+    _ensure_dotenv_loaded()
     with open(config_path, "r", encoding="utf-8") as f:
         raw = yaml.safe_load(f)
 
@@ -48,6 +77,11 @@ def load_config(config_path: str) -> Settings:
         postgres_user=raw["database"].get("postgres", {}).get("user"),
         postgres_password=raw["database"].get("postgres", {}).get("password"),
         postgres_database=raw["database"].get("postgres", {}).get("database"),
+        pool_size=int(raw["database"].get("pool_size", 20)),
+        max_overflow=int(raw["database"].get("max_overflow", 10)),
+        pool_timeout=int(raw["database"].get("pool_timeout", 30)),
+        pool_recycle=int(raw["database"].get("pool_recycle", 3600)),
+        pool_pre_ping=_as_bool(raw["database"].get("pool_pre_ping", True)),
     )
 
     logging = LoggingSettings(**raw["logging"])
@@ -62,15 +96,8 @@ def load_config(config_path: str) -> Settings:
     )
 
     validation_raw = raw.get("validation", {}) or {}
-    raw_enabled = validation_raw.get("enabled", False)
-    parsed_enabled = (
-        str(raw_enabled).lower() in {"1", "true", "yes", "on"}
-        if isinstance(raw_enabled, str)
-        else bool(raw_enabled)
-    )
-
     validation = ValidationSettings(
-        enabled=parsed_enabled,
+        enabled=_as_bool(validation_raw.get("enabled", False)),
         sample_interval_ms=int(validation_raw.get("sample_interval_ms", 250)),
         stats_log_interval_sec=int(validation_raw.get("stats_log_interval_sec", 5)),
         sqlite_flush_every_n=int(validation_raw.get("sqlite_flush_every_n", 50)),
@@ -78,7 +105,7 @@ def load_config(config_path: str) -> Settings:
 
     strategy_raw = raw.get("strategy", {}) or {}
     strategy = StrategySettings(
-        would_trade=str(strategy_raw.get("would_trade", False)).lower() in {"1", "true", "yes", "on"},
+        would_trade=_as_bool(strategy_raw.get("would_trade", False)),
         trace_every_seconds=int(strategy_raw.get("trace_every_seconds", 10)),
     )
 
@@ -140,6 +167,11 @@ def apply_env_overrides(raw: Dict[str, Any]) -> Dict[str, Any]:
     raw.setdefault("database", {})
     raw["database"]["backend"] = env.get("DB_BACKEND", raw["database"].get("backend", "sqlite"))
     raw["database"]["sqlite_path"] = env.get("SQLITE_PATH", raw["database"].get("sqlite_path", "data/arb_bot.sqlite"))
+    raw["database"]["pool_size"] = int(env.get("DB_POOL_SIZE", raw["database"].get("pool_size", 20)))
+    raw["database"]["max_overflow"] = int(env.get("DB_MAX_OVERFLOW", raw["database"].get("max_overflow", 10)))
+    raw["database"]["pool_timeout"] = int(env.get("DB_POOL_TIMEOUT", raw["database"].get("pool_timeout", 30)))
+    raw["database"]["pool_recycle"] = int(env.get("DB_POOL_RECYCLE", raw["database"].get("pool_recycle", 3600)))
+    raw["database"]["pool_pre_ping"] = env.get("DB_POOL_PRE_PING", raw["database"].get("pool_pre_ping", True))
     raw.setdefault("database", {}).setdefault("postgres", {})
     pg = raw["database"]["postgres"]
     pg["host"] = env.get("POSTGRES_HOST", pg.get("host"))
@@ -151,7 +183,7 @@ def apply_env_overrides(raw: Dict[str, Any]) -> Dict[str, Any]:
     raw.setdefault("logging", {})
     raw["logging"]["level"] = env.get("LOG_LEVEL", raw["logging"].get("level", "INFO"))
     raw["logging"]["log_file"] = env.get("LOG_FILE", raw["logging"].get("log_file", "data/bot.log"))
-    raw["logging"]["console"] = str(env.get("LOG_CONSOLE", raw["logging"].get("console", "true"))).lower() in {"1", "true", "yes", "on"}
+    raw["logging"]["console"] = _as_bool(env.get("LOG_CONSOLE", raw["logging"].get("console", "true")))
 
     raw.setdefault("observability", {})
     raw["observability"]["log_top_n_each_sec"] = int(
@@ -48,6 +48,11 @@ class DatabaseSettings:
     postgres_user: Optional[str] = None
     postgres_password: Optional[str] = None
     postgres_database: Optional[str] = None
+    pool_size: int = 20
+    max_overflow: int = 10
+    pool_timeout: int = 30
+    pool_recycle: int = 3600
+    pool_pre_ping: bool = True
 
 
 @dataclass
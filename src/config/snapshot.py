@@ -1,14 +1,32 @@
 from __future__ import annotations
 
+import copy
+import weakref
 from dataclasses import asdict, is_dataclass
 from typing import Any, Dict
 
 from src.config.models import Settings
 
+# Snapshots keyed by id(settings); entries are evicted when the Settings
+# object is garbage collected so a recycled id never returns a stale dict.
+_snapshot_cache: Dict[int, Dict[str, Any]] = {}
+
 
 def safe_config_snapshot(settings: Settings) -> Dict[str, Any]:
+    """Return a plain-dict view of ``settings``.
+
+    Dataclass snapshots are computed once per Settings instance; overrides
+    must be applied before the first snapshot is taken. Each caller gets its
+    own copy, so mutating the result never leaks into later snapshots.
+    """
     if is_dataclass(settings):
-        return asdict(settings)
+        key = id(settings)
+        cached = _snapshot_cache.get(key)
+        if cached is None:
+            cached = asdict(settings)
+            _snapshot_cache[key] = cached
+            weakref.finalize(settings, _snapshot_cache.pop, key, None)
+        return copy.deepcopy(cached)
     if hasattr(settings, "dict"):
         return settings.dict()
     return dict(settings)
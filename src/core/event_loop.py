@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import asyncio
+
+
+def install_uvloop() -> bool:
+    """Use uvloop for subsequent asyncio.run calls when it is installed.
+
+    Returns True if the uvloop policy was installed. uvloop is an optional
+    speedup (not available on Windows); the default loop is kept otherwise.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
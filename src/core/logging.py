@@ -1,14 +1,26 @@
 from __future__ import annotations
 
+import atexit
+import functools
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
 from src.config.models import LoggingSettings
 
+_listener: Optional[QueueListener] = None
+
 
 def setup_logging(settings: LoggingSettings) -> None:
+    global _listener
+
+    root = logging.getLogger()
+    if root.handlers:
+        # Same contract as logging.basicConfig: never stack a second setup.
+        return
+
     level = getattr(logging, settings.level.upper(), logging.INFO)
     log_format = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
     handlers = []
@@ -25,8 +37,17 @@ def setup_logging(settings: LoggingSettings) -> None:
         console_handler.setLevel(level)
         handlers.append(console_handler)
 
-    logging.basicConfig(level=level, handlers=handlers, format=log_format)
+    # The event loop only enqueues records; file/console I/O (including
+    # rotation) happens on the listener thread.
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    root.setLevel(level)
+    root.addHandler(QueueHandler(log_queue))
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     return logging.getLogger(name)
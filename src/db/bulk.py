@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import io
+import json
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
+
+from src.config.models import Settings
+from src.db.models import Base
+from src.db.session import get_engine, init_db
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def bulk_insert(
+    session,
+    model,
+    rows: Sequence[Dict[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Insert ``rows`` into ``model``'s table via Core executemany.
+
+    Bypasses the ORM unit of work (no identity map or per-row flush plan).
+    The caller owns the transaction and commits. Returns the row count.
+    """
+    if not rows:
+        return 0
+    statement = model.__table__.insert()
+    chunk_size = max(1, chunk_size)
+    for start in range(0, len(rows), chunk_size):
+        session.execute(statement, list(rows[start : start + chunk_size]))
+    return len(rows)
+
+
+def bulk_insert_returning_ids(
+    session,
+    model,
+    rows: Sequence[Dict[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[int]:
+    """Insert ``rows`` and return their primary keys in input order.
+
+    On dialects with RETURNING (Postgres) each chunk is one multi-row
+    ``INSERT ... VALUES ... RETURNING id``; all rows must share the same keys.
+    Elsewhere rows are inserted one by one. The caller commits.
+    """
+    if not rows:
+        return []
+    table = model.__table__
+    if not getattr(session.get_bind().dialect, "full_returning", False):
+        statement = table.insert()
+        return [session.execute(statement, row).inserted_primary_key[0] for row in rows]
+    chunk_size = max(1, chunk_size)
+    ids: List[int] = []
+    for start in range(0, len(rows), chunk_size):
+        statement = table.insert().values(list(rows[start : start + chunk_size])).returning(table.c.id)
+        ids.extend(session.execute(statement).scalars())
+    return ids
+
+
+def init_bulk_load(settings: Settings, rows_by_table: Mapping[str, Sequence[Dict[str, Any]]]) -> Dict[str, int]:
+    """Initialise the database and seed it with ``rows_by_table`` in bulk.
+
+    Postgres streams each table through ``COPY ... FROM STDIN``. SQLite drops
+    the table's secondary indexes, inserts everything in one transaction and
+    rebuilds the indexes afterwards. Returns the row count per table.
+    """
+    init_db(settings)
+    engine = get_engine(settings)
+    loaded: Dict[str, int] = {}
+    for table_name, rows in rows_by_table.items():
+        table = Base.metadata.tables[table_name]
+        if not rows:
+            loaded[table_name] = 0
+            continue
+        if settings.database.backend == "postgres":
+            _copy_rows(engine, table, rows)
+        else:
+            with engine.begin() as connection:
+                indexes = list(table.indexes)
+                for index in indexes:
+                    index.drop(connection, checkfirst=True)
+                connection.execute(table.insert(), list(rows))
+                for index in indexes:
+                    index.create(connection)
+        loaded[table_name] = len(rows)
+    return loaded
+
+
+# COPY reads this unquoted marker as NULL. Strings are always quoted, so an
+# empty string, or one that happens to read \N, is never taken for NULL.
+_COPY_NULL = "\\N"
+
+
+def _csv_field(value: Any) -> str:
+    if value is None:
+        return _COPY_NULL
+    if isinstance(value, (bool, int, float)):
+        return str(value)
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _copy_rows(engine, table, rows: Iterable[Dict[str, Any]]) -> None:
+    rows = list(rows)
+    columns = [column for column in table.columns if any(column.name in row for row in rows)]
+    # COPY bypasses SQLAlchemy's parameter handling, so apply each column
+    # type's bind processing (e.g. MicrosecondTimestamp) here.
+    processors = [column.type.bind_processor(engine.dialect) for column in columns]
+    buffer = io.StringIO()
+    for row in rows:
+        fields = []
+        for column, process in zip(columns, processors):
+            value = row.get(column.name)
+            if process is not None:
+                value = process(value)
+            fields.append(_csv_field(value))
+        buffer.write(",".join(fields))
+        buffer.write("\n")
+    buffer.seek(0)
+    raw_connection = engine.raw_connection()
+    try:
+        cursor = raw_connection.cursor()
+        cursor.copy_expert(
+            f"COPY {table.name} ({', '.join(column.name for column in columns)}) FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')",
+            buffer,
+        )
+        raw_connection.commit()
+    finally:
+        raw_connection.close()
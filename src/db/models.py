@@ -1,9 +1,35 @@
-from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String, JSON
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, Float, Index, Integer, String, JSON
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import configure_mappers, declarative_base
+from sqlalchemy.types import TypeDecorator
 
 
 Base = declarative_base()
 
+# Binary JSONB on Postgres (no re-parse on read, GIN-indexable); plain JSON elsewhere.
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+class MicrosecondTimestamp(TypeDecorator):
+    """Unix time in seconds (float) on the Python side, integer microseconds in the DB.
+
+    Integer keys are smaller and compare exactly in range scans; callers keep
+    passing and reading ``time.time()``-style floats.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return int(round(value * 1_000_000))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return value / 1_000_000
+
 
 class RunMetadata(Base):
     __tablename__ = "run_metadata"
@@ -11,15 +37,16 @@ class RunMetadata(Base):
     run_id = Column(String, unique=True, index=True)
     start_timestamp = Column(Float)
     end_timestamp = Column(Float, nullable=True)
-    config_snapshot = Column(JSON)
+    config_snapshot = Column(JSONType)
     notes = Column(String, nullable=True)
 
 
 class Opportunity(Base):
     __tablename__ = "opportunities"
+    __table_args__ = (Index("ix_opps_run_ts", "run_id", "timestamp"),)
     id = Column(Integer, primary_key=True)
     run_id = Column(String, index=True)
-    timestamp = Column(Float)
+    timestamp = Column(MicrosecondTimestamp)
     triangle_id = Column(Integer)
     asset_a = Column(String)
     asset_b = Column(String)
@@ -30,15 +57,16 @@ class Opportunity(Base):
     estimated_slippage_leg1 = Column(Float)
     estimated_slippage_leg2 = Column(Float)
     estimated_slippage_leg3 = Column(Float)
-    parameters_snapshot = Column(JSON)
+    parameters_snapshot = Column(JSONType)
 
 
 class TriangularOpportunity(Base):
     __tablename__ = "triangular_opportunities"
+    __table_args__ = (Index("ix_tri_triangle_ts", "triangle_id", "timestamp_unix"),)
     id = Column(Integer, primary_key=True)
     triangle_id = Column(Integer, index=True)
     timestamp = Column(String)
-    timestamp_unix = Column(Float, index=True)
+    timestamp_unix = Column(MicrosecondTimestamp, index=True)
     asset_a = Column(String)
     asset_b = Column(String)
     asset_c = Column(String)
@@ -54,9 +82,10 @@ class TriangularOpportunity(Base):
 
 class PaperTrade(Base):
     __tablename__ = "paper_trades"
+    __table_args__ = (Index("ix_trades_run_ts", "run_id", "timestamp"),)
     id = Column(Integer, primary_key=True)
     run_id = Column(String, index=True)
-    timestamp = Column(Float)
+    timestamp = Column(MicrosecondTimestamp)
     triangle_id = Column(Integer)
     initial_size = Column(Float)
     realized_final_amount = Column(Float)
@@ -76,20 +105,11 @@ class PortfolioSnapshot(Base):
     __tablename__ = "portfolio_snapshots"
     id = Column(Integer, primary_key=True)
     run_id = Column(String, index=True)
-    timestamp = Column(Float)
-    balances = Column(JSON)
+    timestamp = Column(MicrosecondTimestamp)
+    balances = Column(JSONType)
     total_value_in_quote = Column(Float)
 
 
-class RuntimeStatus(Base):
-    __tablename__ = "runtime_status"
-    id = Column(Integer, primary_key=True)
-    bot_enabled = Column(Boolean, default=True)
-    bot_running = Column(Boolean, default=False)
-    ws_connected = Column(Boolean, default=False)
-    last_heartbeat = Column(Float, nullable=True)
-
-
 class Status(Base):
     __tablename__ = "status"
     id = Column(Integer, primary_key=True)
@@ -100,6 +120,11 @@ class Status(Base):
     last_heartbeat = Column(Float, nullable=True)
 
 
+# The legacy runtime_status table duplicated every status column except
+# dashboard_connected; both names now map to the single status row.
+RuntimeStatus = Status
+
+
 class ProfitOpportunity(Base):
     __tablename__ = "profit_opportunities"
     id = Column(Integer, primary_key=True)
@@ -126,6 +151,7 @@ class SpotPerpOpportunity(Base):
 
 class DecisionSnapshot(Base):
     __tablename__ = "decision_snapshots"
+    __table_args__ = (Index("ix_decision_asset_ts", "asset", "ts_ms"),)
     id = Column(Integer, primary_key=True)
     ts_ms = Column(Integer)
     asset = Column(String, index=True)
@@ -169,3 +195,7 @@ class MakerProbe(Base):
     perp_bid_next = Column(Float, nullable=True)
     perp_ask_next = Column(Float, nullable=True)
     dt_next_ms = Column(Float, nullable=True)
+
+
+# Resolve all mappers once at import instead of lazily on the first Session use.
+configure_mappers()
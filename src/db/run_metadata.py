@@ -3,8 +3,12 @@ from __future__ import annotations
 import time
 from typing import Any, Dict
 
+from sqlalchemy import bindparam, select
+
 from src.db.models import RunMetadata
 
+_select_run_by_id = select(RunMetadata).where(RunMetadata.run_id == bindparam("run_id"))
+
 
 def create_run_metadata(session, run_id: str, config_snapshot: Dict[str, Any]) -> RunMetadata:
     run_metadata = RunMetadata(
@@ -13,14 +17,14 @@ def create_run_metadata(session, run_id: str, config_snapshot: Dict[str, Any]) -
         end_timestamp=None,
         config_snapshot=config_snapshot,
     )
-    session.add(run_metadata)
-    session.commit()
+    with session.begin():
+        session.add(run_metadata)
     return run_metadata
 
 
 def update_run_metadata_end(session, run_id: str) -> None:
-    run_metadata = session.query(RunMetadata).filter(RunMetadata.run_id == run_id).one_or_none()
-    if run_metadata is None:
-        return
-    run_metadata.end_timestamp = time.time()
-    session.commit()
+    with session.begin():
+        run_metadata = session.execute(_select_run_by_id, {"run_id": run_id}).scalar_one_or_none()
+        if run_metadata is None:
+            return
+        run_metadata.end_timestamp = time.time()
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import threading
 import time
-from typing import Any
+from typing import Any, Callable, Dict, Optional
 
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
-from src.db.models import RuntimeStatus, Status
+from src.db.models import Status
+from src.utils.session_scope import session_scope
 
 
 DEFAULT_STATUS = {
@@ -17,52 +22,101 @@ DEFAULT_STATUS = {
     "last_heartbeat": None,
 }
 
-RUNTIME_DEFAULT_STATUS = {
-    key: value for key, value in DEFAULT_STATUS.items() if key != "dashboard_connected"
-}
-
 
-def ensure_runtime_status_row(session: Session) -> RuntimeStatus:
-    status = session.query(RuntimeStatus).filter_by(id=1).first()
-    if not status:
-        status = RuntimeStatus(**RUNTIME_DEFAULT_STATUS)
-        session.add(status)
-        session.commit()
-        session.refresh(status)
-    return status
+def _insert_default_row(session: Session, model: Any, values: Dict[str, Any]) -> None:
+    """Insert the singleton status row unless another writer already did."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        statement = postgresql_insert(model).values(**values).on_conflict_do_nothing(index_elements=["id"])
+    elif dialect == "sqlite":
+        statement = sqlite_insert(model).values(**values).on_conflict_do_nothing(index_elements=["id"])
+    else:
+        if session.get(model, values["id"]) is None:
+            session.add(model(**values))
+            session.commit()
+        return
+    session.execute(statement)
+    session.commit()
 
 
 def ensure_status_row(session: Session) -> Status:
-    status = session.query(Status).filter_by(id=1).first()
-    if not status:
-        status = Status(**DEFAULT_STATUS)
-        session.add(status)
-        session.commit()
-        session.refresh(status)
+    # Identity-map lookup: no SQL at all once the row is loaded in this session.
+    status = session.get(Status, 1)
+    if status is None:
+        _insert_default_row(session, Status, DEFAULT_STATUS)
+        status = session.get(Status, 1)
     return status
 
 
+def ensure_runtime_status_row(session: Session) -> Status:
+    """Kept for callers of the former runtime_status table; same row as ensure_status_row."""
+    return ensure_status_row(session)
+
+
 def get_runtime_status(session: Session) -> Status:
-    ensure_runtime_status_row(session)
     return ensure_status_row(session)
 
 
 def update_runtime_status(session: Session, **fields: Any) -> Status:
-    legacy_status = ensure_runtime_status_row(session)
     status = ensure_status_row(session)
 
     for key, value in fields.items():
-        if hasattr(legacy_status, key):
-            setattr(legacy_status, key, value)
         if hasattr(status, key):
             setattr(status, key, value)
 
     if "last_heartbeat" not in fields:
-        now = status.last_heartbeat or time.time()
-        status.last_heartbeat = now
-        legacy_status.last_heartbeat = now
+        status.last_heartbeat = status.last_heartbeat or time.time()
 
     session.commit()
-    session.refresh(legacy_status)
     session.refresh(status)
     return status
+
+
+class RuntimeStatusWriter:
+    """Coalesce runtime status updates into one UPDATE per flush window.
+
+    Heartbeat-style callers update the status every few seconds; merging
+    fields over ``delay`` seconds turns each burst into a single transaction.
+    Use ``force=True`` (or :meth:`flush`) when the write must land
+    immediately, e.g. on startup and shutdown.
+    """
+
+    def __init__(self, session_factory: Callable[[], Any], delay: float = 0.5) -> None:
+        self._session_factory = session_factory
+        self._delay = delay
+        self._pending: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        # Held from taking the pending fields until they are committed, so
+        # flushes land in the order their fields were collected and a slow
+        # timer flush cannot overwrite a later forced one.
+        self._write_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._rows_ready = False
+
+    def update(self, force: bool = False, **fields: Any) -> None:
+        with self._lock:
+            self._pending.update(fields)
+            if not force and self._timer is None:
+                self._timer = threading.Timer(self._delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if force:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            with session_scope(self._session_factory) as session:
+                if not self._rows_ready:
+                    ensure_status_row(session)
+                    self._rows_ready = True
+                values = {key: value for key, value in pending.items() if key in Status.__table__.c}
+                if values:
+                    session.execute(update(Status).where(Status.id == 1).values(**values))
+                session.commit()
@@ -2,23 +2,54 @@ from __future__ import annotations
 
 import os
 from contextlib import contextmanager
-from typing import Iterator, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 
-from src.config.loader import load_config
-from src.config.models import Settings
 from src.db.models import Base
-from src.db.runtime_status import ensure_runtime_status_row, ensure_status_row
+from src.db.runtime_status import ensure_status_row
+
+if TYPE_CHECKING:
+    from src.config.models import Settings
+
+# SQLAlchemy's default of 500 churns with the many insert column variants
+# written by the recorders.
+QUERY_CACHE_SIZE = 1200
 
 _engine_cache = {}
+_sessionmaker_cache = {}
+_default_settings: Optional[Settings] = None
+# Process that owns the pooled connections in the engine caches.
+_engine_pid = os.getpid()
+
+
+def _dispose_inherited_pools() -> None:
+    """Drop pooled connections inherited from a parent process.
+
+    close=False leaves the parent's sockets alone; the engines stay cached
+    and open fresh connections on next checkout.
+    """
+    global _engine_pid
+    _engine_pid = os.getpid()
+    for engine in _engine_cache.values():
+        engine.dispose(close=False)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_dispose_inherited_pools)
+
+
+SQLITE_MEMORY_PATH = ":memory:"
 
 
 def build_connection_string(settings: Settings) -> str:
     if settings.database.backend == "sqlite":
         db_path = settings.database.sqlite_path
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        db_dir = os.path.dirname(db_path)
+        if db_path != SQLITE_MEMORY_PATH and db_dir:
+            os.makedirs(db_dir, exist_ok=True)
         return f"sqlite:///{db_path}"
     if settings.database.backend == "postgres":
         return (
@@ -28,27 +59,105 @@ def build_connection_string(settings: Settings) -> str:
     raise ValueError("Unsupported DB backend")
 
 
+def _engine_options(settings: Settings) -> Dict[str, Any]:
+    db = settings.database
+    pool_options = {
+        "pool_size": db.pool_size,
+        "max_overflow": db.max_overflow,
+        "pool_timeout": db.pool_timeout,
+    }
+    if db.backend == "postgres":
+        # psycopg2 fast execution helpers: multi-row VALUES for INSERT
+        # executemany, execute_batch for everything else.
+        return {
+            **pool_options,
+            "pool_pre_ping": db.pool_pre_ping,
+            "pool_recycle": db.pool_recycle,
+            "executemany_mode": "values_plus_batch",
+            "executemany_values_page_size": 1000,
+            "executemany_batch_page_size": 500,
+        }
+    if db.backend == "sqlite":
+        if db.sqlite_path == SQLITE_MEMORY_PATH:
+            # Every new connection to :memory: is a separate empty database,
+            # so all checkouts must share the one connection.
+            return {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
+        # File databases default to NullPool (a fresh connection, plus the
+        # pragma hook, on every checkout); pool them instead.
+        return {
+            **pool_options,
+            "poolclass": QueuePool,
+            "connect_args": {"check_same_thread": False},
+        }
+    return {}
+
+
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    # WAL lets the API/dashboard read while the bot writes. With
+    # synchronous=NORMAL a power loss or OS crash can drop the last
+    # committed transactions (the database itself stays consistent); an
+    # application crash loses nothing.
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+
+
 def get_engine(settings: Settings):
+    if _engine_pid != os.getpid():
+        _dispose_inherited_pools()
     conn = build_connection_string(settings)
     if conn not in _engine_cache:
-        _engine_cache[conn] = create_engine(conn, echo=False, future=True)
+        engine = create_engine(
+            conn,
+            echo=False,
+            future=True,
+            query_cache_size=QUERY_CACHE_SIZE,
+            **_engine_options(settings),
+        )
+        if settings.database.backend == "sqlite":
+            event.listen(engine, "connect", _set_sqlite_pragmas)
+        _engine_cache[conn] = engine
     return _engine_cache[conn]
 
 
 def init_db(settings: Settings) -> None:
     engine = get_engine(settings)
-    Base.metadata.create_all(engine)
-    if settings.database.backend == "sqlite":
-        _ensure_spot_perp_run_id_column(engine)
-    Session = sessionmaker(engine, expire_on_commit=False)
-    session = Session()
+    prepare_schema(engine, settings.database.backend)
+    session = _get_sessionmaker(engine)()
     try:
-        ensure_runtime_status_row(session)
         ensure_status_row(session)
     finally:
         session.close()
 
 
+def prepare_schema(engine, backend: str) -> None:
+    """Create missing tables and bring an existing database up to the current schema.
+
+    Every process that opens the database (bot, API, dashboard) must run this
+    before reading, so older databases are migrated before their values are
+    interpreted with the current column types.
+    """
+    Base.metadata.create_all(engine)
+    if backend == "sqlite":
+        _ensure_spot_perp_run_id_column(engine)
+    _ensure_indexes(engine)
+    _ensure_microsecond_timestamps(engine, backend)
+    if backend == "postgres":
+        _ensure_postgres_jsonb_columns(engine)
+
+
+def _ensure_indexes(engine) -> None:
+    # create_all skips tables that already exist, so indexes added to the
+    # models later would never reach older databases.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+
 def _ensure_spot_perp_run_id_column(engine) -> None:
     with engine.begin() as connection:
         result = connection.execute(text("PRAGMA table_info(spot_perp_opportunities)"))
@@ -59,10 +168,110 @@ def _ensure_spot_perp_run_id_column(engine) -> None:
             )
 
 
+_MICROSECOND_COLUMNS = (
+    ("opportunities", "timestamp"),
+    ("paper_trades", "timestamp"),
+    ("triangular_opportunities", "timestamp_unix"),
+    ("portfolio_snapshots", "timestamp"),
+)
+
+# Any stored value below this is still in seconds (1e11 s is year 5138).
+_SECONDS_CEILING = 100_000_000_000
+
+# PRAGMA user_version from which SQLite timestamp columns hold microseconds.
+_SQLITE_MICROSECOND_VERSION = 1
+
+
+def _ensure_microsecond_timestamps(engine, backend: str) -> None:
+    # Tables created before the switch hold float seconds.
+    with engine.begin() as connection:
+        if backend == "postgres":
+            for table, column in _MICROSECOND_COLUMNS:
+                data_type = connection.execute(
+                    text(
+                        "SELECT data_type FROM information_schema.columns "
+                        "WHERE table_name = :table AND column_name = :column"
+                    ),
+                    {"table": table, "column": column},
+                ).scalar()
+                if data_type == "double precision":
+                    connection.execute(
+                        text(
+                            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE BIGINT "
+                            f"USING round({column} * 1000000)::bigint"
+                        )
+                    )
+        elif backend == "sqlite":
+            # SQLite cannot change the declared type, so the values are
+            # rescaled once and the database is stamped via user_version.
+            version = connection.execute(text("PRAGMA user_version")).scalar() or 0
+            if version >= _SQLITE_MICROSECOND_VERSION:
+                return
+            for table, column in _MICROSECOND_COLUMNS:
+                # The ceiling guard keeps rows already rescaled by an
+                # unstamped earlier run from being multiplied again.
+                connection.execute(
+                    text(
+                        f"UPDATE {table} SET {column} = CAST(round({column} * 1000000) AS INTEGER) "
+                        f"WHERE {column} IS NOT NULL AND {column} < :ceiling"
+                    ),
+                    {"ceiling": _SECONDS_CEILING},
+                )
+            connection.execute(text(f"PRAGMA user_version = {_SQLITE_MICROSECOND_VERSION}"))
+
+
+_JSONB_COLUMNS = (
+    ("run_metadata", "config_snapshot"),
+    ("opportunities", "parameters_snapshot"),
+    ("portfolio_snapshots", "balances"),
+)
+
+
+def _ensure_postgres_jsonb_columns(engine) -> None:
+    # Tables created before the JSONB switch still have json columns.
+    with engine.begin() as connection:
+        for table, column in _JSONB_COLUMNS:
+            data_type = connection.execute(
+                text(
+                    "SELECT data_type FROM information_schema.columns "
+                    "WHERE table_name = :table AND column_name = :column"
+                ),
+                {"table": table, "column": column},
+            ).scalar()
+            if data_type == "json":
+                connection.execute(
+                    text(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb")
+                )
+        connection.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_run_metadata_config_gin "
+                "ON run_metadata USING gin (config_snapshot jsonb_path_ops)"
+            )
+        )
+
+
+def _get_sessionmaker(engine) -> sessionmaker:
+    Session = _sessionmaker_cache.get(engine)
+    if Session is None:
+        Session = sessionmaker(engine, expire_on_commit=False)
+        _sessionmaker_cache[engine] = Session
+    return Session
+
+
+def _load_default_settings() -> Settings:
+    global _default_settings
+    if _default_settings is None:
+        # Deferred: callers that pass settings never need the YAML loader.
+        from src.config.loader import load_config
+
+        _default_settings = load_config("config/config.yaml")
+    return _default_settings
+
+
 def get_session(settings: Optional[Settings] = None):
-    settings = settings or load_config("config/config.yaml")
+    settings = settings or _load_default_settings()
     engine = get_engine(settings)
-    Session = sessionmaker(engine, expire_on_commit=False)
+    Session = _get_sessionmaker(engine)
 
     @contextmanager
     def session_scope() -> Iterator:
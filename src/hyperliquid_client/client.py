@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import os
 import json
+import logging
 import random
 import time
-from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
 import httpx
 import websockets
@@ -20,6 +22,13 @@ try:  # websockets >= 10
 except ImportError:  # websockets < 10 compatibility
     from websockets.legacy.client import WebSocketClientProtocol  # type: ignore[attr-defined]
 
+# orjson is an optional speedup for the large /info payloads; the stdlib
+# decoder is used when it is not installed.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 from src.config.models import APISettings
 from src.core.logging import get_logger
 from src.observability.feed_health import FeedHealthTracker, normalize_timestamp_seconds
@@ -29,6 +38,82 @@ logger = get_logger(__name__)
 BOOKS_IDLE_TIMEOUT = int(os.getenv("HL_BOOKS_IDLE_TIMEOUT", "20"))
 BOOKS_SOCKET_CAP = int(os.getenv("HL_BOOKS_SOCKET_CAP", "3"))
 SPOT_L2BOOK_WAIT_SECONDS = float(os.getenv("HL_SPOT_L2BOOK_WAIT_SECONDS", "3"))
+META_CACHE_TTL_SECONDS = 60
+# permessage-deflate trades bandwidth for an inflate (plus buffer copy) on
+# every frame; the feed is CPU-bound, so it is off unless HL_WS_COMPRESSION=1.
+WS_COMPRESSION = os.getenv("HL_WS_COMPRESSION", "0") == "1"
+# websockets reads frames on its own task into a bounded queue that recv()
+# drains; a deeper queue lets bursts land while listeners run instead of
+# pausing socket reads at the library default (16 messages on the asyncio
+# client, 32 on the legacy one shipped with websockets 12).
+WS_MAX_QUEUE = int(os.getenv("HL_WS_MAX_QUEUE", "1024"))
+
+_WS_CONNECT_OPTIONS: Dict[str, Any] = {
+    "ping_interval": 5,
+    "ping_timeout": 5,
+    "close_timeout": 5,
+    "compression": "deflate" if WS_COMPRESSION else None,
+    "max_queue": WS_MAX_QUEUE,
+}
+
+# Message kinds returned by HyperliquidClient._classify.
+_KIND_NONE = 0
+_KIND_L2BOOK = 1
+_KIND_MARK = 2
+_KIND_ALL_MIDS = 3
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+_L2BOOK_TYPES = frozenset({"l2Book", "l2book"})
+_MARK_TYPES = frozenset({"markPrice", "activeAssetCtx"})
+
+_TS_KEYS = ("time", "ts", "timestamp")
+_MARK_KEYS = ("markPx", "mark", "price")
+
+
+def _json_loads(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _json_snippet(obj: Any, limit: int) -> str:
+    """Serialize ``obj`` for a log line, truncated to ``limit`` characters."""
+    if orjson is not None:
+        return orjson.dumps(obj)[:limit].decode("utf-8", "replace")
+    return json.dumps(obj)[:limit]
+
+
+def _first_value(mapping: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """Return the first truthy value of ``keys`` in ``mapping``, else None."""
+    for key in keys:
+        value = mapping.get(key)
+        if value:
+            return value
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _mid_symbols(base: str) -> Tuple[str, str]:
+    """allMids keys probed for ``base``, in preference order."""
+    return base, f"{base}/USDC"
+
+
+@functools.lru_cache(maxsize=4096)
+def _encode_subscription(items: Tuple[Tuple[str, Any], ...]) -> Tuple[str, str]:
+    """Return (dedup key, subscribe frame) for a subscription given as sorted items.
+
+    Subscriptions are fully determined by (type, coin, isPerp), so both
+    strings are built once per subscription instead of on every call.
+    """
+    sub = dict(items)
+    return json.dumps(sub, sort_keys=True), _json_dumps({"method": "subscribe", "subscription": sub})
 
 
 class HyperliquidClient:
@@ -46,23 +131,33 @@ class HyperliquidClient:
         self._ws_market: Optional[WebSocketClientProtocol] = None
         self._ws_books: Dict[str, WebSocketClientProtocol] = {}
         self._ws_lock = None
-        self._session = httpx.AsyncClient(timeout=10.0)
+        # Every REST call goes to the same /info host: keep one multiplexed
+        # HTTP/2 connection warm instead of re-handshaking TLS.
+        self._session = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+        )
         self._connected_event = None
         # Market data caches
         self._orderbooks_spot: Dict[str, Dict[str, Any]] = {}
         self._orderbooks_perp: Dict[str, Dict[str, Any]] = {}
         self._marks: Dict[str, float] = {}
-        self._mids_map: Dict[str, float] = {}
         self._spot_symbol_to_base: Dict[str, str] = {}
         self._perp_symbol_to_base: Dict[str, str] = {}
+        # Wire coin -> (kind, asset, reason) for subscribed books, so the hot
+        # path resolves a known coin with a single lookup.
+        self._kind_map: Dict[str, Tuple[str, str, str]] = {}
         self._mark_symbol_to_base: Dict[str, str] = {}
 
         # Tracking assets
         self._tracked_bases: set[str] = set()
 
         # Subscriptions/bookkeeping
-        self._orderbook_listeners: List[Callable[[str, str, Dict[str, Any]], None]] = []
-        self._mark_listeners: List[Callable[[str, float, Dict[str, Any]], None]] = []
+        # Copy-on-write tuples: registration rebuilds them, dispatch iterates
+        # a stable snapshot even if a listener registers another one.
+        self._orderbook_listeners: Tuple[Callable[[str, str, Dict[str, Any]], None], ...] = ()
+        self._mark_listeners: Tuple[Callable[[str, float, Dict[str, Any]], None], ...] = ()
         self._recv_task_market: Optional[asyncio.Task] = None
         self._recv_tasks_books: Dict[str, asyncio.Task] = {}
         self._ws_runner_task_market: Optional[asyncio.Task] = None
@@ -88,6 +183,8 @@ class HyperliquidClient:
         self._payload_type_warned = False
         self._spot_meta_cache: Optional[Any] = None
         self._spot_meta_cache_time: float = 0.0
+        self._perp_meta_cache: Optional[Any] = None
+        self._perp_meta_cache_time: float = 0.0
         self._connected_event_market = None
         self._connected_event_books = None
         if self._connected_event_books is not None:
@@ -112,6 +209,8 @@ class HyperliquidClient:
             "books": {},
             "books_total": 0,
         }
+        # Indexed by the _KIND_* value from _classify.
+        self._message_handlers = (None, self._handle_l2book, self._handle_mark, self._handle_all_mids)
 
     @property
     def rest_base(self) -> str:
@@ -197,31 +296,41 @@ class HyperliquidClient:
 
 
 
-    async def fetch_info(self) -> Dict[str, Any]:
+    async def _prewarm_http(self) -> None:
+        # Open the HTTP/2 connection before the per-asset snapshot fetches
+        # fan out, so they multiplex on it instead of racing to connect.
+        # Any response (even 404) leaves a warm connection in the pool.
+        try:
+            await self._session.get(self.rest_base)
+        except httpx.HTTPError as exc:
+            logger.debug("[WS_FEED][DEBUG] http prewarm failed: %s", exc)
+
+    async def _post_info(self, payload: Dict[str, Any]) -> httpx.Response:
         url = f"{self.rest_base}{self.api_settings.info_path}"
-        resp = await self._session.post(url, json={"type": "info"})
+        return await self._session.post(url, content=_json_dumps(payload), headers=_JSON_HEADERS)
+
+    async def fetch_info(self) -> Dict[str, Any]:
+        resp = await self._post_info({"type": "info"})
         resp.raise_for_status()
-        return resp.json()
+        return _json_loads(resp.content)
 
     async def fetch_spot_meta(self) -> Dict[str, Any]:
-        url = f"{self.rest_base}{self.api_settings.info_path}"
-        resp = await self._session.post(url, json={"type": "spotMeta"})
+        resp = await self._post_info({"type": "spotMeta"})
         resp.raise_for_status()
-        return resp.json()
+        return _json_loads(resp.content)
 
     async def fetch_spot_meta_and_asset_ctxs(self, use_cache: bool = True) -> Dict[str, Any]:
         now = time.time()
-        if use_cache and self._spot_meta_cache and now - self._spot_meta_cache_time < 60:
+        if use_cache and self._spot_meta_cache and now - self._spot_meta_cache_time < META_CACHE_TTL_SECONDS:
             return self._spot_meta_cache
-        url = f"{self.rest_base}{self.api_settings.info_path}"
-        resp = await self._session.post(url, json={"type": "spotMetaAndAssetCtxs"})
+        resp = await self._post_info({"type": "spotMetaAndAssetCtxs"})
         resp.raise_for_status()
-        data = resp.json()
+        data = _json_loads(resp.content)
         self._spot_meta_cache = data
         self._spot_meta_cache_time = now
         return data
 
-    async def fetch_perp_meta(self) -> Dict[str, Any]:
+    async def fetch_perp_meta(self, use_cache: bool = True) -> Dict[str, Any]:
         """
         Fetch perp market metadata (universe) from Hyperliquid.
 
@@ -229,15 +338,19 @@ class HyperliquidClient:
         a \"meta\" request type. The returned payload contains a \"universe\"
         array with the available perp contracts.
         """
-        url = f"{self.rest_base}{self.api_settings.info_path}"
-        resp = await self._session.post(url, json={"type": "meta"})
+        now = time.time()
+        if use_cache and self._perp_meta_cache and now - self._perp_meta_cache_time < META_CACHE_TTL_SECONDS:
+            return self._perp_meta_cache
+        resp = await self._post_info({"type": "meta"})
         resp.raise_for_status()
-        return resp.json()
+        data = _json_loads(resp.content)
+        self._perp_meta_cache = data
+        self._perp_meta_cache_time = now
+        return data
 
     async def fetch_orderbook_snapshot(
         self, coin: str, *, asset: Optional[str] = None, kind: Optional[str] = None
     ) -> Dict[str, Any]:
-        url = f"{self.rest_base}{self.api_settings.info_path}"
         payload = {"type": "l2Book", "coin": coin}
         asset_key = asset or coin
         kind_label = kind or "unknown"
@@ -247,7 +360,7 @@ class HyperliquidClient:
             kind_label,
             json.dumps(payload, sort_keys=True),
         )
-        resp = await self._session.post(url, json=payload)
+        resp = await self._post_info(payload)
         response_text: Any
         try:
             response_text = resp.text
@@ -266,7 +379,7 @@ class HyperliquidClient:
             snippet,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = _json_loads(resp.content)
         if data is None:
             self._logger.warning(
                 "[WS_BOOKS_%s][BOOTSTRAP][DEBUG_SNAPSHOT] kind=%s [BOOTSTRAP] snapshot response is null",
@@ -278,10 +391,10 @@ class HyperliquidClient:
     # Listener registration -------------------------------------------------
 
     def add_orderbook_listener(self, cb: Callable[[str, str, Dict[str, Any]], None]) -> None:
-        self._orderbook_listeners.append(cb)
+        self._orderbook_listeners = (*self._orderbook_listeners, cb)
 
     def add_mark_listener(self, cb: Callable[[str, float, Dict[str, Any]], None]) -> None:
-        self._mark_listeners.append(cb)
+        self._mark_listeners = (*self._mark_listeners, cb)
 
     def set_feed_health_tracker(self, tracker: FeedHealthTracker) -> None:
         self.feed_health_tracker = tracker
@@ -289,6 +402,10 @@ class HyperliquidClient:
     # WebSocket lifecycle ---------------------------------------------------
 
     async def connect_ws(self) -> None:
+        runner = self._ws_runner_task_market
+        if runner is not None and not runner.done() and self._get_connected_event().is_set():
+            # Steady state: already connected, skip the lock round-trip.
+            return
         async with self._get_ws_lock():
             if self._ws_runner_task_market and not self._ws_runner_task_market.done():
                 await self._get_connected_event().wait()
@@ -334,87 +451,162 @@ class HyperliquidClient:
             self._books_cap_warned = True
         items = items[:BOOKS_SOCKET_CAP]
 
-        for coin, base in items:
-            ws_snapshot_coin = coin
-            fallback_coin: Optional[str] = None
-            payload_coin_override: Optional[str] = None
-            if kind == "perp":
-                perp_key = f"perp:{coin}"
-                self._perp_subscriptions.add(perp_key)
-                self._perp_symbol_to_base[coin] = base
-            else:
-                pair_override = spot_pair_overrides.get(coin) if spot_pair_overrides else None
-                spot_key = f"spot:{coin}"
-                self._spot_subscriptions.add(spot_key)
-                self._spot_symbol_to_base[coin] = base
-                raw_pair = pair_override or (base if "/" in base else f"{base}/USDC")
-                pair = raw_pair.upper()
-                self._spot_pair_map[coin] = pair
-                self._spot_symbol_to_base[pair] = base
-                primary_coin, fallback_coin = await self._resolve_spot_ws_coin(coin, pair)
-                if primary_coin:
-                    self._spot_symbol_to_base[primary_coin] = base
-                    ws_snapshot_coin = primary_coin
-                if fallback_coin and fallback_coin != primary_coin:
-                    self._spot_symbol_to_base[fallback_coin] = base
-                payload_coin_override = self._compute_spot_payload_coin(
-                    coin, pair, primary_coin, fallback_coin
-                )
+        # Each asset has its own books socket, so the per-asset bootstrap
+        # (snapshot fetch, subscribe, first-book wait) runs concurrently.
+        await asyncio.gather(
+            *(
+                self._subscribe_orderbook_asset(coin, base, kind, spot_pair_overrides)
+                for coin, base in items
+            )
+        )
 
-            await self._ensure_books_runner(coin)
-            await self._books_connected_events[coin].wait()
-            if coin not in self._sent_subscriptions_books:
-                self._sent_subscriptions_books[coin] = {"spot": set(), "perp": set()}
-            if kind == "perp" and self._sent_subscriptions_books.get(coin, {}).get("spot"):
-                logger.info(
-                    "[WS_BOOKS_%s][WS_FEED] dual_subscribe spot+perp for same coin", coin
+    async def _subscribe_orderbook_asset(
+        self,
+        coin: str,
+        base: str,
+        kind: str,
+        spot_pair_overrides: Optional[Dict[str, str]],
+    ) -> None:
+        ws_snapshot_coin = coin
+        fallback_coin: Optional[str] = None
+        payload_coin_override: Optional[str] = None
+        if kind == "perp":
+            perp_key = f"perp:{coin}"
+            self._perp_subscriptions.add(perp_key)
+            self._perp_symbol_to_base[coin] = base
+            self._kind_map[coin] = ("perp", base, "perp_map")
+        else:
+            pair_override = spot_pair_overrides.get(coin) if spot_pair_overrides else None
+            spot_key = f"spot:{coin}"
+            self._spot_subscriptions.add(spot_key)
+            self._spot_symbol_to_base[coin] = base
+            raw_pair = pair_override or (base if "/" in base else f"{base}/USDC")
+            pair = raw_pair.upper()
+            self._spot_pair_map[coin] = pair
+            self._spot_symbol_to_base[pair] = base
+            primary_coin, fallback_coin = await self._resolve_spot_ws_coin(coin, pair)
+            if primary_coin:
+                self._spot_symbol_to_base[primary_coin] = base
+                ws_snapshot_coin = primary_coin
+            if fallback_coin and fallback_coin != primary_coin:
+                self._spot_symbol_to_base[fallback_coin] = base
+            payload_coin_override = self._compute_spot_payload_coin(
+                coin, pair, primary_coin, fallback_coin
+            )
+            for wire_coin in (pair, primary_coin, fallback_coin):
+                if wire_coin and wire_coin not in self._perp_symbol_to_base:
+                    self._kind_map.setdefault(wire_coin, ("spot", base, "spot_map"))
+
+        await self._ensure_books_runner(coin)
+        await self._books_connected_events[coin].wait()
+        if coin not in self._sent_subscriptions_books:
+            self._sent_subscriptions_books[coin] = {"spot": set(), "perp": set()}
+        if kind == "perp" and self._sent_subscriptions_books.get(coin, {}).get("spot"):
+            logger.info(
+                "[WS_BOOKS_%s][WS_FEED] dual_subscribe spot+perp for same coin", coin
+            )
+        if kind == "spot" and self._sent_subscriptions_books.get(coin, {}).get("perp"):
+            logger.info(
+                "[WS_BOOKS_%s][WS_FEED] dual_subscribe spot+perp for same coin", coin
+            )
+        sub_key = (
+            self._build_l2book_key(payload_coin_override, False)
+            if kind == "spot"
+            else self._build_l2book_key(coin, True)
+        )
+        sent_set = self._sent_subscriptions_books.get(coin, {}).get(kind) or set()
+        if sub_key and sub_key in sent_set:
+            logger.info(
+                "[WS_BOOKS_%s][WS_FEED] skipping duplicate l2Book subscribe key=%s kind=%s",
+                coin,
+                sub_key,
+                kind,
+            )
+            return
+        logger.info("[WS_BOOKS_%s] subscribing single l2Book: %s (%s)", coin, coin, kind)
+
+        try:
+            snapshot_coin = coin if kind == "perp" else payload_coin_override or ws_snapshot_coin
+            snapshot = await self.fetch_orderbook_snapshot(
+                snapshot_coin, asset=coin, kind=kind
+            )
+            spot_snapshot_missing = kind == "spot" and snapshot is None
+            if spot_snapshot_missing:
+                self._logger.warning(
+                    "[WS_BOOKS_%s][BOOTSTRAP] spot snapshot unavailable (null) -> waiting WS book",
+                    coin,
                 )
-            if kind == "spot" and self._sent_subscriptions_books.get(coin, {}).get("perp"):
-                logger.info(
-                    "[WS_BOOKS_%s][WS_FEED] dual_subscribe spot+perp for same coin", coin
+                self._orderbooks_spot.pop(base, None)
+                tracker = getattr(self, "feed_health_tracker", None)
+                if tracker:
+                    tracker.get_asset_health(base).spot.incomplete = True
+            else:
+                payload = self._extract_payload(snapshot)
+                levels = payload.get("levels") or payload
+
+                bids_source: Any = None
+                asks_source: Any = None
+
+                if isinstance(levels, dict):
+                    bids_source = levels.get("bids")
+                    asks_source = levels.get("asks")
+                elif isinstance(levels, (list, tuple)) and len(levels) >= 2:
+                    bids_source, asks_source = levels[0], levels[1]
+
+                bids = (
+                    bids_source
+                    if isinstance(bids_source, list)
+                    else payload.get("bids")
+                    if isinstance(payload.get("bids"), list)
+                    else []
                 )
-            sub_key = (
-                self._build_l2book_key(payload_coin_override, False)
-                if kind == "spot"
-                else self._build_l2book_key(coin, True)
-            )
-            sent_set = self._sent_subscriptions_books.get(coin, {}).get(kind) or set()
-            if sub_key and sub_key in sent_set:
+                asks = (
+                    asks_source
+                    if isinstance(asks_source, list)
+                    else payload.get("asks")
+                    if isinstance(payload.get("asks"), list)
+                    else []
+                )
+
+                best_bid = self._best_price(bids, reverse=True)
+                best_ask = self._best_price(asks, reverse=False)
+                best_bid = float(best_bid) if best_bid is not None else 0.0
+                best_ask = float(best_ask) if best_ask is not None else 0.0
+                ts = _first_value(payload, _TS_KEYS) or time.time()
+
+                norm = {"bid": best_bid, "ask": best_ask, "bids": bids, "asks": asks, "ts": ts}
+                target_cache = self._orderbooks_perp if kind == "perp" else self._orderbooks_spot
+                target_cache[base] = norm
+
                 logger.info(
-                    "[WS_BOOKS_%s][WS_FEED] skipping duplicate l2Book subscribe key=%s kind=%s",
+                    "[WS_BOOKS_%s][BOOTSTRAP] applied snapshot kind=%s bid=%s ask=%s",
                     coin,
-                    sub_key,
                     kind,
+                    best_bid,
+                    best_ask,
                 )
-                continue
-            logger.info("[WS_BOOKS_%s] subscribing single l2Book: %s (%s)", coin, coin, kind)
-
-            try:
-                snapshot_coin = coin if kind == "perp" else payload_coin_override or ws_snapshot_coin
-                snapshot = await self.fetch_orderbook_snapshot(
-                    snapshot_coin, asset=coin, kind=kind
-                )
-                spot_snapshot_missing = kind == "spot" and snapshot is None
-                if spot_snapshot_missing:
-                    self._logger.warning(
-                        "[WS_BOOKS_%s][BOOTSTRAP] spot snapshot unavailable (null) -> waiting WS book",
+                self._books_snapshot_applied.add(base)
+                if kind == "spot":
+                    spot_event = self._spot_l2book_events.setdefault(base, asyncio.Event())
+                    spot_event.set()
+        except Exception as exc:
+            if kind == "spot" and fallback_coin and fallback_coin != ws_snapshot_coin:
+                try:
+                    logger.info(
+                        "[WS_BOOKS_%s][BOOTSTRAP] retrying snapshot with fallback coin=%s after %s",
                         coin,
+                        fallback_coin,
+                        type(exc).__name__,
+                    )
+                    snapshot = await self.fetch_orderbook_snapshot(
+                        fallback_coin, asset=coin, kind=kind
                     )
-                    self._orderbooks_spot.pop(base, None)
-                    tracker = getattr(self, "feed_health_tracker", None)
-                    if tracker:
-                        tracker.get_asset_health(base).spot.incomplete = True
-                else:
                     payload = self._extract_payload(snapshot)
                     levels = payload.get("levels") or payload
 
-                    bids_source: Any = None
-                    asks_source: Any = None
-
-                    if isinstance(levels, dict):
-                        bids_source = levels.get("bids")
-                        asks_source = levels.get("asks")
-                    elif isinstance(levels, (list, tuple)) and len(levels) >= 2:
+                    bids_source = levels.get("bids") if isinstance(levels, dict) else None
+                    asks_source = levels.get("asks") if isinstance(levels, dict) else None
+                    if isinstance(levels, (list, tuple)) and len(levels) >= 2:
                         bids_source, asks_source = levels[0], levels[1]
 
                     bids = (
@@ -431,113 +623,47 @@ class HyperliquidClient:
                         if isinstance(payload.get("asks"), list)
                         else []
                     )
-
                     best_bid = self._best_price(bids, reverse=True)
                     best_ask = self._best_price(asks, reverse=False)
                     best_bid = float(best_bid) if best_bid is not None else 0.0
                     best_ask = float(best_ask) if best_ask is not None else 0.0
-                    ts = (
-                        payload.get("time")
-                        or payload.get("ts")
-                        or payload.get("timestamp")
-                        or time.time()
-                    )
-
-                    norm = {"bid": best_bid, "ask": best_ask, "bids": bids, "asks": asks, "ts": ts}
-                    target_cache = self._orderbooks_perp if kind == "perp" else self._orderbooks_spot
+                    ts = _first_value(payload, _TS_KEYS) or time.time()
+                    norm = {
+                        "bid": best_bid,
+                        "ask": best_ask,
+                        "bids": bids,
+                        "asks": asks,
+                        "ts": ts,
+                    }
+                    target_cache = self._orderbooks_spot
                     target_cache[base] = norm
-
                     logger.info(
-                        "[WS_BOOKS_%s][BOOTSTRAP] applied snapshot kind=%s bid=%s ask=%s",
+                        "[WS_BOOKS_%s][BOOTSTRAP] applied snapshot kind=%s bid=%s ask=%s (fallback coin=%s)",
                         coin,
                         kind,
                         best_bid,
                         best_ask,
+                        fallback_coin,
                     )
                     self._books_snapshot_applied.add(base)
-                    if kind == "spot":
-                        spot_event = self._spot_l2book_events.setdefault(base, asyncio.Event())
-                        spot_event.set()
-            except Exception as exc:
-                if kind == "spot" and fallback_coin and fallback_coin != ws_snapshot_coin:
-                    try:
-                        logger.info(
-                            "[WS_BOOKS_%s][BOOTSTRAP] retrying snapshot with fallback coin=%s after %s",
-                            coin,
-                            fallback_coin,
-                            type(exc).__name__,
-                        )
-                        snapshot = await self.fetch_orderbook_snapshot(
-                            fallback_coin, asset=coin, kind=kind
-                        )
-                        payload = self._extract_payload(snapshot)
-                        levels = payload.get("levels") or payload
-
-                        bids_source = levels.get("bids") if isinstance(levels, dict) else None
-                        asks_source = levels.get("asks") if isinstance(levels, dict) else None
-                        if isinstance(levels, (list, tuple)) and len(levels) >= 2:
-                            bids_source, asks_source = levels[0], levels[1]
-
-                        bids = (
-                            bids_source
-                            if isinstance(bids_source, list)
-                            else payload.get("bids")
-                            if isinstance(payload.get("bids"), list)
-                            else []
-                        )
-                        asks = (
-                            asks_source
-                            if isinstance(asks_source, list)
-                            else payload.get("asks")
-                            if isinstance(payload.get("asks"), list)
-                            else []
-                        )
-                        best_bid = self._best_price(bids, reverse=True)
-                        best_ask = self._best_price(asks, reverse=False)
-                        best_bid = float(best_bid) if best_bid is not None else 0.0
-                        best_ask = float(best_ask) if best_ask is not None else 0.0
-                        ts = (
-                            payload.get("time")
-                            or payload.get("ts")
-                            or payload.get("timestamp")
-                            or time.time()
-                        )
-                        norm = {
-                            "bid": best_bid,
-                            "ask": best_ask,
-                            "bids": bids,
-                            "asks": asks,
-                            "ts": ts,
-                        }
-                        target_cache = self._orderbooks_spot
-                        target_cache[base] = norm
-                        logger.info(
-                            "[WS_BOOKS_%s][BOOTSTRAP] applied snapshot kind=%s bid=%s ask=%s (fallback coin=%s)",
-                            coin,
-                            kind,
-                            best_bid,
-                            best_ask,
-                            fallback_coin,
-                        )
-                        self._books_snapshot_applied.add(base)
-                        spot_event = self._spot_l2book_events.setdefault(base, asyncio.Event())
-                        spot_event.set()
-                    except Exception as snapshot_exc:  # pragma: no cover - defensive
-                        logger.warning(
-                            "[WS_BOOKS_%s][BOOTSTRAP] snapshot failed after fallback: %s",
-                            coin,
-                            snapshot_exc,
-                        )
-                else:
-                    logger.warning("[WS_BOOKS_%s][BOOTSTRAP] snapshot failed: %s", coin, exc)
-
-            if kind == "spot":
-                spot_pair = self._spot_pair_map.get(coin) or base
-                await self._subscribe_spot_books(
-                    coin, spot_pair, (ws_snapshot_coin, fallback_coin), payload_coin_override
-                )
+                    spot_event = self._spot_l2book_events.setdefault(base, asyncio.Event())
+                    spot_event.set()
+                except Exception as snapshot_exc:  # pragma: no cover - defensive
+                    logger.warning(
+                        "[WS_BOOKS_%s][BOOTSTRAP] snapshot failed after fallback: %s",
+                        coin,
+                        snapshot_exc,
+                    )
             else:
-                await self._subscribe_books(coin, kind, coin)
+                logger.warning("[WS_BOOKS_%s][BOOTSTRAP] snapshot failed: %s", coin, exc)
+
+        if kind == "spot":
+            spot_pair = self._spot_pair_map.get(coin) or base
+            await self._subscribe_spot_books(
+                coin, spot_pair, (ws_snapshot_coin, fallback_coin), payload_coin_override
+            )
+        else:
+            await self._subscribe_books(coin, kind, coin)
 
     async def _ensure_books_runner(self, asset: str) -> None:
         if asset not in self._books_connected_events:
@@ -557,7 +683,7 @@ class HyperliquidClient:
         if not self._ws_market:
             raise RuntimeError("WebSocket not connected")
         for coin, base in symbol_map.items():
-            sub_key = json.dumps({"type": "activeAssetCtx", "coin": coin}, sort_keys=True)
+            sub_key = _encode_subscription((("coin", coin), ("type", "activeAssetCtx")))[0]
             self._mark_subscriptions.add(sub_key)
             self._mark_symbol_to_base[coin] = base
             await self._subscribe_market(coin)
@@ -587,13 +713,15 @@ class HyperliquidClient:
             normalized_spot_pairs = {
                 self._normalize_spot_symbol(symbol): pair for symbol, pair in spot_pair_overrides.items()
             }
-        await self.connect_ws()
+        await asyncio.gather(self.connect_ws(), self._prewarm_http())
         if coins_mark_list:
             await self.subscribe_mark_prices(mark_symbols)
-        await self.subscribe_orderbooks(spot_symbols, kind="spot", spot_pair_overrides=normalized_spot_pairs)
-        await self.subscribe_orderbooks(perp_symbols, kind="perp")
+        await asyncio.gather(
+            self.subscribe_orderbooks(spot_symbols, kind="spot", spot_pair_overrides=normalized_spot_pairs),
+            self.subscribe_orderbooks(perp_symbols, kind="perp"),
+        )
 
-    def _handle_ws_message(self, msg: Dict[str, Any]) -> None:
+    def _handle_ws_message(self, msg: Dict[str, Any], kind: Optional[int] = None) -> None:
         if msg.get("channel") == "error" or msg.get("type") == "error":
             logger.error("[WS_FEED][ERROR] subscribe_error msg=%s", msg)
             return
@@ -608,16 +736,12 @@ class HyperliquidClient:
             logger.info("[WS_FEED][INFO] subscriptionResponse msg=%s", msg)
             return
 
-        handled = False
-        if self._is_l2book(msg):
-            handled = True
-            self._handle_l2book(msg)
-        if self._is_mark_price(msg):
-            handled = True
-            self._handle_mark(msg)
-        if self._is_all_mids(msg):
-            handled = True
-            self._handle_all_mids(msg)
+        if kind is None:
+            kind = self._classify(msg)
+        handler = self._message_handlers[kind]
+        handled = handler is not None
+        if handled:
+            handler(msg)
 
         if handled and not self._first_market_logged:
             self._first_market_logged = True
@@ -638,10 +762,21 @@ class HyperliquidClient:
         asset: Optional[str] = None,
     ) -> None:
         sample_limit = 5
+        # Loop-invariant flags, read as locals in the per-message path;
+        # ``sampling`` drops to False once the shared sample budget is spent.
+        sampling = self._raw_sample_logged < sample_limit
+        is_books = name.startswith("WS_BOOKS")
+        # Bound once per connection; the loop body runs for every frame.
+        recv = ws.recv
+        ensure_dict = self._ensure_dict
+        iterate_payload = self._iterate_payload
+        classify = self._classify
+        handle_message = self._handle_ws_message
+        books_last_l2book = self._books_last_l2book
         try:
             while True:
                 try:
-                    raw_msg = await ws.recv()
+                    raw_msg = await recv()
                 except websockets.ConnectionClosed:
                     raise
                 except Exception as exc:  # pragma: no cover - defensive
@@ -653,7 +788,7 @@ class HyperliquidClient:
                     on_first_message()
                     on_first_message = None
 
-                parsed_msg = self._ensure_dict(raw_msg)
+                parsed_msg = ensure_dict(raw_msg)
                 if parsed_msg is None:
                     continue
 
@@ -661,10 +796,10 @@ class HyperliquidClient:
                     self._log_payload_shape(parsed_msg)
                     for item in parsed_msg:
                         if isinstance(item, dict):
-                            self._handle_ws_message(item)
+                            handle_message(item)
                     continue
 
-                for msg in self._iterate_payload(parsed_msg):
+                for msg in iterate_payload(parsed_msg):
                     tracker = getattr(self, "feed_health_tracker", None)
                     if tracker:
                         try:
@@ -676,36 +811,46 @@ class HyperliquidClient:
                             logger.debug("[%s][WS_FEED] duplicate message dropped", name)
                             continue
                     if isinstance(msg, dict):
-                        ch = msg.get("channel")
-                        keys = list(msg.keys())
-                        dkeys = list(msg.get("data", {}).keys()) if isinstance(msg.get("data"), dict) else None
-                        self._logger.info(
-                            "[%s][RAW_RECV] channel=%s keys=%s data_keys=%s", name, ch, keys, dkeys
-                        )
+                        # The key lists are built per frame, so only when the
+                        # record would actually be emitted.
+                        if self._logger.isEnabledFor(logging.INFO):
+                            data = msg.get("data")
+                            dkeys = list(data.keys()) if isinstance(data, dict) else None
+                            self._logger.info(
+                                "[%s][RAW_RECV] channel=%s keys=%s data_keys=%s",
+                                name,
+                                msg.get("channel"),
+                                list(msg.keys()),
+                                dkeys,
+                            )
                     else:
                         self._logger.info("[%s][RAW_RECV] non-dict msg=%r", name, raw_msg)
                         continue
 
-                    if self._raw_sample_logged < sample_limit:
-                        self._raw_sample_logged += 1
-                        try:
-                            snippet = json.dumps(msg)
-                        except Exception:
-                            snippet = str(msg)
-                        logger.info(
-                            "[WS_FEED][SAMPLE] keys=%s msg=%s",
-                            list(msg.keys()),
-                            snippet[:500],
-                        )
-                    if name.startswith("WS_BOOKS") and self._is_l2book(msg):
+                    if sampling:
+                        if self._raw_sample_logged < sample_limit and logger.isEnabledFor(logging.INFO):
+                            self._raw_sample_logged += 1
+                            try:
+                                snippet = _json_snippet(msg, 500)
+                            except Exception:
+                                snippet = str(msg)[:500]
+                            logger.info(
+                                "[WS_FEED][SAMPLE] keys=%s msg=%s",
+                                list(msg.keys()),
+                                snippet,
+                            )
+                        else:
+                            sampling = False
+                    kind = classify(msg)
+                    if kind == _KIND_L2BOOK and is_books:
                         payload = self._extract_payload(msg)
                         coin = payload.get("coin") or payload.get("asset") or msg.get("coin") or msg.get("asset")
                         now = time.monotonic()
                         if asset:
-                            self._books_last_l2book[asset] = now
+                            books_last_l2book[asset] = now
                         if isinstance(coin, str) and coin and coin != asset:
-                            self._books_last_l2book[coin] = now
-                    self._handle_ws_message(msg)
+                            books_last_l2book[coin] = now
+                    handle_message(msg, kind)
         except websockets.ConnectionClosed as e:
             self._logger.warning(
                 "[%s] recv loop ConnectionClosed code=%s reason=%s",
@@ -713,7 +858,7 @@ class HyperliquidClient:
                 getattr(e, "code", None),
                 getattr(e, "reason", None),
             )
-            if name.startswith("WS_BOOKS"):
+            if is_books:
                 self._register_reconnect("books", asset, getattr(e, "code", None))
             else:
                 self._register_reconnect("market", None, getattr(e, "code", None))
@@ -733,12 +878,7 @@ class HyperliquidClient:
             sleep_delay = self._reconnect_delay
             try:
                 self._logger.info("Connecting to Hyperliquid WebSocket (%s): %s", name, self.websocket_url)
-                ws = await websockets.connect(
-                    self.websocket_url,
-                    ping_interval=5,
-                    ping_timeout=5,
-                    close_timeout=5,
-                )
+                ws = await websockets.connect(self.websocket_url, **_WS_CONNECT_OPTIONS)
                 self._ws_books[asset] = ws
                 self._books_connected_events[asset].set()
                 self._update_books_connected_event()
@@ -815,12 +955,7 @@ class HyperliquidClient:
             sleep_delay = self._reconnect_delay
             try:
                 self._logger.info("Connecting to Hyperliquid WebSocket (%s): %s", name, self.websocket_url)
-                ws = await websockets.connect(
-                    self.websocket_url,
-                    ping_interval=5,
-                    ping_timeout=5,
-                    close_timeout=5,
-                )
+                ws = await websockets.connect(self.websocket_url, **_WS_CONNECT_OPTIONS)
                 setattr(self, set_ws_attr, ws)
                 connected_event.set()
                 self._update_connected_event()
@@ -972,56 +1107,51 @@ class HyperliquidClient:
     def _ensure_dict(self, raw_msg: Any) -> Optional[Any]:
         if isinstance(raw_msg, (dict, list)):
             return raw_msg
-        if isinstance(raw_msg, (bytes, bytearray)):
-            try:
-                raw_msg = raw_msg.decode()
-            except Exception:
-                logger.debug("[WS_FEED][DEBUG] Unable to decode bytes message: %s", raw_msg)
-                return None
-        if isinstance(raw_msg, str):
+        if isinstance(raw_msg, memoryview):
+            raw_msg = raw_msg.tobytes()
+        # Both decoders take UTF-8 bytes directly; no intermediate str copy.
+        if isinstance(raw_msg, (str, bytes, bytearray)):
             try:
-                return json.loads(raw_msg)
+                return _json_loads(raw_msg)
             except Exception:
                 logger.debug("[WS_FEED][DEBUG] Failed to parse JSON: %s", raw_msg)
                 return None
         logger.debug("[WS_FEED][DEBUG] Received non-JSON message: %s", raw_msg)
         return None
 
-    def _is_l2book(self, msg: Dict[str, Any]) -> bool:
-        if msg.get("channel") in {"l2Book", "l2book"}:
-            return True
-        if msg.get("type") in {"l2Book", "l2book"}:
-            return True
-        subscription = msg.get("subscription") or {}
-        if isinstance(subscription, dict) and subscription.get("type") == "l2Book":
-            return True
-        data = msg.get("data") or msg.get("result")
-        if isinstance(data, dict) and data.get("type") in {"l2Book", "l2book"}:
-            return True
-        return False
-
-    def _is_mark_price(self, msg: Dict[str, Any]) -> bool:
-        if msg.get("channel") in {"activeAssetCtx"}:
-            return True
-        if msg.get("type") in {"markPrice", "activeAssetCtx"}:
-            return True
-        subscription = msg.get("subscription") or {}
-        if isinstance(subscription, dict) and subscription.get("type") == "activeAssetCtx":
-            return True
+    def _classify(self, msg: Dict[str, Any]) -> int:
+        """Return the _KIND_* of a WS message in one pass over its type fields."""
+        channel = msg.get("channel")
+        if channel in _L2BOOK_TYPES:
+            return _KIND_L2BOOK
+        if channel == "activeAssetCtx":
+            return _KIND_MARK
+        if channel == "allMids":
+            return _KIND_ALL_MIDS
+        msg_type = msg.get("type")
+        if msg_type in _L2BOOK_TYPES:
+            return _KIND_L2BOOK
+        if msg_type in _MARK_TYPES:
+            return _KIND_MARK
+        if msg_type == "allMids":
+            return _KIND_ALL_MIDS
+        subscription = msg.get("subscription")
+        if isinstance(subscription, dict):
+            sub_type = subscription.get("type")
+            if sub_type == "l2Book":
+                return _KIND_L2BOOK
+            if sub_type == "activeAssetCtx":
+                return _KIND_MARK
         data = msg.get("data") or msg.get("result")
-        if isinstance(data, dict) and data.get("type") in {"markPrice", "activeAssetCtx"}:
-            return True
-        return False
-
-    def _is_all_mids(self, msg: Dict[str, Any]) -> bool:
-        if msg.get("channel") == "allMids":
-            return True
-        if msg.get("type") == "allMids":
-            return True
-        data = msg.get("data") or msg.get("result")
-        if isinstance(data, dict) and data.get("type") == "allMids":
-            return True
-        return False
+        if isinstance(data, dict):
+            data_type = data.get("type")
+            if data_type in _L2BOOK_TYPES:
+                return _KIND_L2BOOK
+            if data_type in _MARK_TYPES:
+                return _KIND_MARK
+            if data_type == "allMids":
+                return _KIND_ALL_MIDS
+        return _KIND_NONE
 
     async def _subscribe_market(self, coin: str) -> None:
         sub_payload = {"type": "activeAssetCtx", "coin": coin}
@@ -1100,7 +1230,7 @@ class HyperliquidClient:
             )
         except WebSocketException:
             self._sent_subscriptions_books[asset]["spot"].discard(
-                json.dumps(sub_payload, sort_keys=True)
+                _encode_subscription(tuple(sorted(sub_payload.items())))[0]
             )
             raise
 
@@ -1149,22 +1279,22 @@ class HyperliquidClient:
             ws = getattr(self, ws_attr)
         if not ws:
             raise RuntimeError(f"WebSocket not connected for {name}")
-        key = json.dumps(sub, sort_keys=True)
+        key, frame = _encode_subscription(tuple(sorted(sub.items())))
         if key in sent_set:
             logger.info("[%s][WS_FEED] Already subscribed key=%s", name, key)
             return
         sent_set.add(key)
-        payload = {"method": "subscribe", "subscription": sub}
-        logger.info("[%s][WS_FEED] sent subscribe sub=%s", name, json.dumps(sub, sort_keys=True))
-        logger.info("[%s][WS_FEED][INFO] sending_subscribe payload=%s", name, json.dumps(payload))
-        await ws.send(json.dumps(payload))
+        logger.info("[%s][WS_FEED] sent subscribe sub=%s", name, key)
+        logger.info("[%s][WS_FEED][INFO] sending_subscribe payload=%s", name, frame)
+        await ws.send(frame)
 
-    def _handle_l2book(self, msg: Dict[str, Any]) -> None:
+    def _split_l2book(self, msg: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], str, List[Any], List[Any]]]:
+        """Return (payload, coin, bids, asks) for any supported l2Book layout."""
         payload = self._extract_payload(msg)
         coin = payload.get("coin") or payload.get("asset") or msg.get("coin") or msg.get("asset")
         if not coin:
             logger.debug("[WS_FEED][DEBUG] l2Book without coin: %s", msg)
-            return
+            return None
 
         levels = payload.get("levels") or payload
         bids_source: Any = None
@@ -1184,16 +1314,39 @@ class HyperliquidClient:
 
         bids = bids_source if isinstance(bids_source, list) else payload.get("bids") if isinstance(payload.get("bids"), list) else []
         asks = asks_source if isinstance(asks_source, list) else payload.get("asks") if isinstance(payload.get("asks"), list) else []
+        return payload, coin, bids, asks
+
+    def _handle_l2book(self, msg: Dict[str, Any]) -> None:
+        # Hyperliquid sends {"data": {"coin", "time", "levels": [bids, asks]}};
+        # that layout is read directly and everything else goes through
+        # _split_l2book.
+        payload = msg.get("data")
+        levels = payload.get("levels") if type(payload) is dict else None
+        if (
+            type(levels) is list
+            and len(levels) == 2
+            and type(levels[0]) is list
+            and type(levels[1]) is list
+            and payload.get("coin")
+        ):
+            coin = payload["coin"]
+            bids, asks = levels
+            # The exchange sends each side sorted best-first.
+            best_bid = self._top_price(bids, reverse=True)
+            best_ask = self._top_price(asks, reverse=False)
+        else:
+            split = self._split_l2book(msg)
+            if split is None:
+                return
+            payload, coin, bids, asks = split
+            best_bid = self._best_price(bids, reverse=True)
+            best_ask = self._best_price(asks, reverse=False)
 
-        best_bid = self._best_price(bids, reverse=True)
-        best_ask = self._best_price(asks, reverse=False)
         best_bid = float(best_bid) if best_bid is not None else 0.0
         best_ask = float(best_ask) if best_ask is not None else 0.0
-        raw_ts = payload.get("time") or payload.get("ts") or payload.get("timestamp") or msg.get("time") or msg.get("ts")
+        raw_ts = _first_value(payload, _TS_KEYS) or _first_value(msg, _TS_KEYS)
         ts = normalize_timestamp_seconds(raw_ts)
 
-        norm = {"bid": best_bid, "ask": best_ask, "bids": bids, "asks": asks, "ts": ts}
-
         if not self._first_l2book_logged:
             self._first_l2book_logged = True
             logger.info(
@@ -1208,10 +1361,19 @@ class HyperliquidClient:
                 "[WS_FEED][INFO] l2book_kind_resolved asset=%s kind=%s reason=%s", asset, kind, reason
             )
 
-        if kind == "perp":
-            self._orderbooks_perp[asset] = norm
-        else:
-            self._orderbooks_spot[asset] = norm
+        # One long-lived dict per asset, updated in place on every delta;
+        # listeners copy what they need and do not keep a reference.
+        book_cache = self._orderbooks_perp if kind == "perp" else self._orderbooks_spot
+        norm = book_cache.get(asset)
+        if norm is None:
+            norm = book_cache[asset] = {}
+        norm["bid"] = best_bid
+        norm["ask"] = best_ask
+        norm["bids"] = bids
+        norm["asks"] = asks
+        norm["ts"] = ts
+
+        if kind != "perp":
             asset_key_base = asset
             asset_key_pair = coin if isinstance(coin, str) and "/" in coin else None
             for key in (asset_key_base, asset_key_pair):
@@ -1249,11 +1411,19 @@ class HyperliquidClient:
         if tracker:
             tracker.on_book_update(asset, kind, best_bid, best_ask, ts, bids, asks)
 
-        for cb in self._orderbook_listeners:
+        listeners = self._orderbook_listeners
+        if len(listeners) == 1:
+            # Common case: one consumer, no loop.
             try:
-                cb(kind, asset, norm)
+                listeners[0](kind, asset, norm)
             except Exception as exc:  # pragma: no cover - defensive
                 logger.warning("Orderbook listener error: %s", exc)
+        elif listeners:
+            for cb in listeners:
+                try:
+                    cb(kind, asset, norm)
+                except Exception as exc:  # pragma: no cover - defensive
+                    logger.warning("Orderbook listener error: %s", exc)
 
         sub_key = self._build_l2book_key(coin, kind == "perp")
         if sub_key:
@@ -1281,22 +1451,17 @@ class HyperliquidClient:
 
         raw_mark = None
         if is_active_ctx and ctx:
-            for key in ("markPx", "mark", "price"):
+            for key in _MARK_KEYS:
                 if key in ctx:
                     raw_mark = ctx.get(key)
                     break
         if raw_mark is None:
-            raw_mark = (
-                payload.get("markPx")
-                or payload.get("mark")
-                or payload.get("price")
-                or msg.get("mark")
-            )
+            raw_mark = _first_value(payload, _MARK_KEYS) or msg.get("mark")
         try:
-            mark = float(raw_mark)
+            mark = raw_mark if type(raw_mark) is float else float(raw_mark)
         except Exception:
             mark = None
-        raw_ts = payload.get("time") or payload.get("ts") or payload.get("timestamp") or msg.get("time") or msg.get("ts")
+        raw_ts = _first_value(payload, _TS_KEYS) or _first_value(msg, _TS_KEYS)
         ts = normalize_timestamp_seconds(raw_ts)
 
         if mark is None:
@@ -1313,11 +1478,18 @@ class HyperliquidClient:
             logger.info("[WS_FEED][INFO] first_mark_received asset=%s", base)
         self._mark_ok[base] = True
 
-        for cb in self._mark_listeners:
+        listeners = self._mark_listeners
+        if len(listeners) == 1:
             try:
-                cb(base, mark, payload)
+                listeners[0](base, mark, payload)
             except Exception as exc:  # pragma: no cover - defensive
                 logger.warning("Mark listener error: %s", exc)
+        elif listeners:
+            for cb in listeners:
+                try:
+                    cb(base, mark, payload)
+                except Exception as exc:  # pragma: no cover - defensive
+                    logger.warning("Mark listener error: %s", exc)
 
     def _handle_all_mids(self, msg: Dict[str, Any]) -> None:
         payload = msg.get("data") or msg.get("result") or {}
@@ -1337,36 +1509,46 @@ class HyperliquidClient:
             self._first_allmids_logged = True
             logger.info("[WS_FEED][INFO] first_allmids_received")
 
-        self._mids_map = {}
-        for coin, mid_val in mids.items():
-            try:
-                mid = float(mid_val)
-            except Exception:
-                logger.debug("[WS_FEED][DEBUG] invalid mid price coin=%s val=%s", coin, mid_val)
-                continue
-            self._mids_map[coin] = mid
-
+        # allMids carries every listed coin; only the tracked bases are
+        # looked up and converted rather than the whole map.
         now = time.time()
+        listeners = self._mark_listeners
+        marks = self._marks
+        # One payload per frame, updated per base; like the cached book
+        # dicts, listeners must copy it if they keep it past the call.
+        payload_out: Dict[str, Any] = {"mid": None, "time": now, "symbol": None}
         targets = self._tracked_bases or set(self._mark_symbol_to_base.values())
         for base in targets:
             mid = None
             source_symbol = None
-            for symbol in (base, f"{base}/USDC"):
-                if symbol in self._mids_map:
-                    mid = self._mids_map[symbol]
-                    source_symbol = symbol
-                    break
+            for symbol in _mid_symbols(base):
+                mid_val = mids.get(symbol)
+                if mid_val is None:
+                    continue
+                try:
+                    mid = float(mid_val)
+                except Exception:
+                    logger.debug("[WS_FEED][DEBUG] invalid mid price coin=%s val=%s", symbol, mid_val)
+                    continue
+                source_symbol = symbol
+                break
             if mid is None:
                 continue
-            self._marks[base] = mid
-            payload_out = {"mid": mid, "time": now, "symbol": source_symbol or base}
-            for cb in self._mark_listeners:
+            marks[base] = mid
+            if not listeners:
+                continue
+            payload_out["mid"] = mid
+            payload_out["symbol"] = source_symbol or base
+            for cb in listeners:
                 try:
                     cb(base, mid, payload_out)
                 except Exception as exc:  # pragma: no cover - defensive
                     logger.warning("Mark listener error: %s", exc)
 
     def _extract_payload(self, msg: Dict[str, Any]) -> Dict[str, Any]:
+        data = msg.get("data")
+        if type(data) is dict:
+            return data
         for key in ("data", "result", "payload"):
             val = msg.get(key)
             if isinstance(val, dict):
@@ -1376,7 +1558,10 @@ class HyperliquidClient:
     def _detect_kind(
         self, payload: Dict[str, Any], msg: Dict[str, Any], coin: str
     ) -> tuple[str, str, str]:
-        subscription = msg.get("subscription") if isinstance(msg.get("subscription"), dict) else {}
+        cached = self._kind_map.get(coin)
+        if cached is not None:
+            return cached
+        subscription = msg.get("subscription")
         is_perp = payload.get("perp") or payload.get("isPerp") or payload.get("contractType") == "perp"
         is_perp = is_perp or msg.get("isPerp") or (isinstance(subscription, dict) and subscription.get("isPerp"))
         if is_perp:
@@ -1389,19 +1574,42 @@ class HyperliquidClient:
             return "spot", coin.split("/")[0], "symbol_suffix"
         return "spot", coin, "default"
 
+    def _top_price(self, levels: List[Any], reverse: bool) -> Optional[float]:
+        """Price of the first level of a side already sorted best-first.
+
+        Falls back to scanning the side with _best_price when the first
+        level has no usable price.
+        """
+        if not levels:
+            return None
+        level = levels[0]
+        if type(level) is dict:
+            candidate = level.get("px")
+        elif isinstance(level, (list, tuple)) and level:
+            candidate = level[0]
+        else:
+            candidate = None
+        if candidate is not None:
+            try:
+                return candidate if type(candidate) is float else float(candidate)
+            except (TypeError, ValueError):
+                pass
+        return self._best_price(levels, reverse)
+
     def _best_price(self, levels: List[Any], reverse: bool) -> Optional[float]:
         best: Optional[float] = None
         for level in levels or []:
             price = None
             if isinstance(level, (list, tuple)) and level:
+                raw = level[0]
                 try:
-                    price = float(level[0])
+                    price = raw if type(raw) is float else float(raw)
                 except Exception:
                     price = None
             elif isinstance(level, dict):
                 candidate = level.get("px") or level.get("price") or level.get("p")
                 try:
-                    price = float(candidate)
+                    price = candidate if type(candidate) is float else float(candidate)
                 except Exception:
                     price = None
             if price is None:
@@ -1581,7 +1789,7 @@ class HyperliquidClient:
         if not coin:
             return None
         try:
-            return json.dumps({"coin": coin, "isPerp": bool(is_perp), "type": "l2Book"}, sort_keys=True)
+            return _encode_subscription((("coin", coin), ("isPerp", bool(is_perp)), ("type", "l2Book")))[0]
         except Exception:
             return None
 
@@ -14,6 +14,7 @@ from sqlalchemy import or_, text
 from src.config.loader import load_config
 from src.config.models import FeedHealthSettings, Settings, TradingSettings, ValidationSettings
 from src.core.logging import get_logger
+from src.db.bulk import bulk_insert
 from src.db.models import Base, DecisionOutcome, DecisionSnapshot, MakerProbe, SpotPerpOpportunity
 from src.db.runtime_status import update_runtime_status
 from src.db.session import get_session
@@ -193,16 +194,16 @@ class ValidationRecorder:
         if not self._snapshots and not self._outcomes:
             return
         with self.session_factory() as session:
-            if self._snapshots:
-                session.execute(
-                    DecisionSnapshot.__table__.insert(),
-                    [self._snapshot_to_row(snapshot) for snapshot in self._snapshots],
-                )
-            if self._outcomes:
-                session.execute(
-                    DecisionOutcome.__table__.insert(),
-                    [self._outcome_to_row(outcome) for outcome in self._outcomes],
-                )
+            bulk_insert(
+                session,
+                DecisionSnapshot,
+                [self._snapshot_to_row(snapshot) for snapshot in self._snapshots],
+            )
+            bulk_insert(
+                session,
+                DecisionOutcome,
+                [self._outcome_to_row(outcome) for outcome in self._outcomes],
+            )
             session.commit()
         batch_size = len(self._outcomes)
         self.validation_written_total += batch_size
@@ -1,6 +1,43 @@
 import sys
 from pathlib import Path
+from typing import Union
+
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+from src.config.models import (  # noqa: E402
+    APISettings,
+    DatabaseSettings,
+    LoggingSettings,
+    ObservabilitySettings,
+    Settings,
+    TradingSettings,
+)
+
+
+@pytest.fixture
+def settings_factory(tmp_path):
+    """Build minimal SQLite-backed testnet Settings for a given database path."""
+
+    def _build(sqlite_path: Union[str, Path]) -> Settings:
+        return Settings(
+            network="testnet",
+            api=APISettings("", "", "", "", ""),
+            trading=TradingSettings(
+                quote_asset="USDC",
+                initial_quote_balance=10000,
+                min_position_size=10,
+                max_position_size=100,
+                min_edge_threshold=0.001,
+                safety_slippage_buffer=0.0,
+                max_concurrent_triangles=5,
+            ),
+            database=DatabaseSettings(backend="sqlite", sqlite_path=str(sqlite_path)),
+            logging=LoggingSettings(level="INFO", log_file=str(tmp_path / "test.log")),
+            observability=ObservabilitySettings(),
+        )
+
+    return _build
@@ -0,0 +1,13 @@
+from src.config.snapshot import safe_config_snapshot
+
+
+def test_safe_config_snapshot_returns_independent_copies(settings_factory):
+    settings = settings_factory(":memory:")
+
+    first = safe_config_snapshot(settings)
+    first["network"] = "mainnet"
+    first["trading"]["quote_asset"] = "USDT"
+    second = safe_config_snapshot(settings)
+
+    assert second["network"] == "testnet"
+    assert second["trading"]["quote_asset"] == "USDC"
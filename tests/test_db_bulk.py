@@ -0,0 +1,132 @@
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects.postgresql import psycopg2
+from sqlalchemy.orm import sessionmaker
+
+from src.db.bulk import _copy_rows, bulk_insert, bulk_insert_returning_ids, init_bulk_load
+from src.db.models import Base, DecisionOutcome, Opportunity
+from src.db.session import get_session
+
+
+def test_bulk_insert_writes_all_chunks():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(engine)
+    rows = [
+        {"ts_ms": i, "asset": "ETH", "outcome": "SKIP", "reason": "STALE", "detail": None}
+        for i in range(7)
+    ]
+
+    with Session() as session:
+        written = bulk_insert(session, DecisionOutcome, rows, chunk_size=3)
+        session.commit()
+        stored = [row.ts_ms for row in session.query(DecisionOutcome).order_by(DecisionOutcome.ts_ms)]
+
+    assert written == 7
+    assert stored == list(range(7))
+
+
+def test_bulk_insert_ignores_empty_batches():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(engine)
+
+    with Session() as session:
+        assert bulk_insert(session, DecisionOutcome, []) == 0
+
+
+def test_bulk_insert_returning_ids_matches_input_order():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(engine)
+    rows = [{"ts_ms": i, "asset": "ETH", "outcome": "SKIP"} for i in range(5)]
+
+    with Session() as session:
+        ids = bulk_insert_returning_ids(session, DecisionOutcome, rows, chunk_size=2)
+        session.commit()
+        stored = {row.id: row.ts_ms for row in session.query(DecisionOutcome)}
+
+    assert [stored[row_id] for row_id in ids] == list(range(5))
+
+
+def test_init_bulk_load_seeds_sqlite_and_keeps_indexes(tmp_path, settings_factory):
+    settings = settings_factory(tmp_path / "seed.db")
+    rows = [{"ts_ms": i, "asset": "ETH", "outcome": "SKIP"} for i in range(5)]
+
+    loaded = init_bulk_load(settings, {"decision_outcomes": rows, "paper_trades": []})
+
+    assert loaded == {"decision_outcomes": 5, "paper_trades": 0}
+    with get_session(settings)() as session:
+        assert session.query(DecisionOutcome).count() == 5
+        index_names = session.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'decision_outcomes'")
+        ).scalars().all()
+    assert "ix_decision_outcomes_asset" in index_names
+
+
+class _RecordingCursor:
+    def __init__(self, copies):
+        self._copies = copies
+
+    def copy_expert(self, sql, buffer):
+        self._copies.append((sql, buffer.read()))
+
+
+class _RecordingRawConnection:
+    def __init__(self, copies):
+        self._copies = copies
+        self.committed = False
+
+    def cursor(self):
+        return _RecordingCursor(self._copies)
+
+    def commit(self):
+        self.committed = True
+
+    def close(self):
+        pass
+
+
+class _RecordingEngine:
+    def __init__(self):
+        self.dialect = psycopg2.dialect()
+        self.copies = []
+        self.connection = _RecordingRawConnection(self.copies)
+
+    def raw_connection(self):
+        return self.connection
+
+
+def test_copy_rows_writes_csv_with_explicit_null_marker():
+    engine = _RecordingEngine()
+    rows = (
+        row
+        for row in [
+            {"ts_ms": 1, "asset": "ETH", "outcome": "SKIP", "reason": "", "detail": None},
+            {"ts_ms": 2, "asset": 'A"B', "outcome": "SKIP", "reason": None, "detail": {"gap": 1}},
+        ]
+    )
+
+    _copy_rows(engine, DecisionOutcome.__table__, rows)
+
+    [(sql, payload)] = engine.copies
+    assert sql == (
+        "COPY decision_outcomes (ts_ms, asset, outcome, reason, detail) "
+        "FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    )
+    assert payload == (
+        '1,"ETH","SKIP","",\\N\n'
+        '2,"A""B","SKIP",\\N,"{""gap"": 1}"\n'
+    )
+    assert engine.connection.committed
+
+
+def test_copy_rows_applies_column_bind_processing():
+    engine = _RecordingEngine()
+    rows = [{"run_id": "r1", "timestamp": 1700000000.25, "parameters_snapshot": {"min_edge": 0.001}}]
+
+    _copy_rows(engine, Opportunity.__table__, rows)
+
+    [(sql, payload)] = engine.copies
+    assert sql.startswith("COPY opportunities (run_id, timestamp, parameters_snapshot) FROM STDIN")
+    # Seconds are stored as integer microseconds, as on the ORM/Core path.
+    assert payload == '"r1",1700000000250000,"{""min_edge"": 0.001}"\n'
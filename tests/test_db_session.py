@@ -0,0 +1,43 @@
+from sqlalchemy import text
+
+from src.db.session import get_engine, get_session, init_db
+
+
+def test_memory_sqlite_shares_one_database_across_sessions(settings_factory):
+    settings = settings_factory(":memory:")
+    init_db(settings)
+    session_scope = get_session(settings)
+
+    with session_scope() as writer, session_scope() as reader:
+        writer.execute(text("CREATE TABLE IF NOT EXISTS probe (value INTEGER)"))
+        writer.execute(text("INSERT INTO probe (value) VALUES (7)"))
+        writer.commit()
+        assert reader.execute(text("SELECT value FROM probe")).scalar() == 7
+        assert reader.execute(text("SELECT count(*) FROM status")).scalar() == 1
+
+    get_engine(settings).dispose()
+
+
+def test_init_db_rescales_sqlite_second_timestamps_once(tmp_path, settings_factory):
+    settings = settings_factory(tmp_path / "legacy.db")
+    init_db(settings)
+    engine = get_engine(settings)
+    with engine.begin() as connection:
+        # Simulate a database written before the microsecond switch.
+        connection.execute(text("PRAGMA user_version = 0"))
+        connection.execute(text("INSERT INTO opportunities (run_id, timestamp) VALUES ('old', 1700000000.5)"))
+
+    init_db(settings)
+
+    with engine.begin() as connection:
+        assert connection.execute(text("PRAGMA user_version")).scalar() == 1
+        stored = connection.execute(text("SELECT timestamp FROM opportunities WHERE run_id = 'old'")).scalar()
+        assert stored == 1700000000500000
+        # Once stamped, later startups leave the table alone.
+        connection.execute(text("INSERT INTO opportunities (run_id, timestamp) VALUES ('raw', 5)"))
+
+    init_db(settings)
+
+    with engine.begin() as connection:
+        assert connection.execute(text("SELECT timestamp FROM opportunities WHERE run_id = 'raw'")).scalar() == 5
+    engine.dispose()
@@ -1,4 +1,6 @@
 import asyncio
+import json
+
 import pytest
 
 from src.config.models import APISettings
@@ -113,3 +115,79 @@ def test_resolve_spot_ws_coin_uses_canonical_pair(monkeypatch: pytest.MonkeyPatc
     assert primary == "PURR/USDC"
     assert fallback == "PURR/USDC"
     assert client.get_resolved_spot_coin("purr") == "PURR/USDC"
+
+
+def test_fetch_perp_meta_reuses_cached_payload(monkeypatch: pytest.MonkeyPatch):
+    client = _make_client()
+    calls = []
+
+    class _FakeResponse:
+        content = b'{"universe": [{"name": "ETH"}]}'
+
+        def raise_for_status(self) -> None:
+            return None
+
+    async def _fake_post(url, content=None, headers=None):
+        calls.append(json.loads(content))
+        return _FakeResponse()
+
+    monkeypatch.setattr(client._session, "post", _fake_post)
+
+    first = asyncio.run(client.fetch_perp_meta())
+    second = asyncio.run(client.fetch_perp_meta())
+    asyncio.run(client.fetch_perp_meta(use_cache=False))
+
+    assert first == second == {"universe": [{"name": "ETH"}]}
+    assert calls == [{"type": "meta"}, {"type": "meta"}]
+
+
+def test_handle_ws_message_dispatches_by_channel():
+    client = _make_client()
+    books = []
+    marks = []
+    client.add_orderbook_listener(lambda kind, asset, norm: books.append((kind, asset, norm["bid"], norm["ask"])))
+    client.add_mark_listener(lambda base, mark, payload: marks.append((base, mark)))
+    client._tracked_bases = {"ETH"}
+
+    client._handle_ws_message(
+        {
+            "channel": "l2Book",
+            "data": {
+                "coin": "ETH",
+                "time": 1700000000000,
+                "levels": [[{"px": "100", "sz": "1"}, {"px": "99", "sz": "2"}], [{"px": "101", "sz": "1"}]],
+            },
+        }
+    )
+    client._handle_ws_message({"channel": "activeAssetCtx", "data": {"coin": "BTC", "ctx": {"markPx": "5"}}})
+    client._handle_ws_message({"channel": "allMids", "data": {"mids": {"ETH": "100.5", "BTC": "5"}}})
+    client._handle_ws_message({"channel": "pong"})
+
+    assert books == [("spot", "ETH", 100.0, 101.0)]
+    assert marks == [("BTC", 5.0), ("ETH", 100.5)]
+
+
+def test_handle_l2book_accepts_bids_asks_dict_layout():
+    client = _make_client()
+    books = []
+    client.add_orderbook_listener(lambda kind, asset, norm: books.append((kind, asset, norm["bid"], norm["ask"])))
+
+    client._handle_l2book(
+        {
+            "channel": "l2Book",
+            "data": {
+                "coin": "ETH/USDC",
+                "levels": {"bids": [{"px": "100", "sz": "1"}], "asks": [{"px": "101", "sz": "1"}]},
+            },
+        }
+    )
+
+    assert books == [("spot", "ETH", 100.0, 101.0)]
+
+
+def test_top_price_reads_first_level_and_falls_back_on_bad_price():
+    client = _make_client()
+
+    assert client._top_price([{"px": "101"}, {"px": "102"}], reverse=False) == 101.0
+    assert client._top_price([{"px": None}, {"px": "99"}, {"px": "98"}], reverse=True) == 99.0
+    assert client._top_price([], reverse=True) is None
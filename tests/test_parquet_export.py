@@ -0,0 +1,54 @@
+import pytest
+
+from src.analysis.parquet_export import export_run_to_parquet, load_parquet_run
+from src.db.models import Opportunity, PaperTrade
+from src.db.session import get_session, init_db
+
+pytest.importorskip("pyarrow")
+
+
+def test_export_run_round_trips_through_parquet(tmp_path, settings_factory):
+    settings = settings_factory(tmp_path / "export.db")
+    init_db(settings)
+    with get_session(settings)() as session:
+        for run_id, base_ts in (("run-a", 1700000000.25), ("run-b", 1700000100.5)):
+            for i in range(3):
+                session.add(
+                    Opportunity(
+                        run_id=run_id,
+                        timestamp=base_ts + i,
+                        triangle_id=i,
+                        asset_a="USDC",
+                        asset_b="ETH",
+                        asset_c="BTC",
+                        initial_size=100.0,
+                        theoretical_final_amount=100.5 + i,
+                        theoretical_edge=0.005,
+                        parameters_snapshot={"min_edge": 0.001},
+                    )
+                )
+        session.add(
+            PaperTrade(
+                run_id="run-a",
+                timestamp=1700000000.75,
+                triangle_id=1,
+                initial_size=100.0,
+                realized_pnl=0.4,
+                was_executed=True,
+            )
+        )
+        session.commit()
+
+    output_dir = str(tmp_path / "parquet")
+    exported = export_run_to_parquet("run-a", output_dir, settings)
+
+    assert exported == {"opportunities": 3, "paper_trades": 1}
+    opportunities = load_parquet_run("opportunities", "run-a", output_dir).sort_values("triangle_id")
+    assert "parameters_snapshot" not in opportunities.columns
+    assert list(opportunities["run_id"].astype(str)) == ["run-a"] * 3
+    assert list(opportunities["timestamp"]) == [1700000000.25, 1700000001.25, 1700000002.25]
+    assert list(opportunities["theoretical_final_amount"]) == [100.5, 101.5, 102.5]
+    trades = load_parquet_run("paper_trades", "run-a", output_dir)
+    assert list(trades["realized_pnl"]) == [0.4]
+    assert list(trades["was_executed"]) == [True]
+    assert load_parquet_run("opportunities", "run-b", output_dir).empty
@@ -0,0 +1,58 @@
+import threading
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.db.models import Base, Status
+from src.db.runtime_status import RuntimeStatusWriter
+
+
+def test_runtime_status_writer_coalesces_pending_fields():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(engine)
+    writer = RuntimeStatusWriter(Session, delay=60)
+
+    writer.update(ws_connected=True)
+    writer.update(ws_connected=False, last_heartbeat=123.0)
+    writer.update(force=True, bot_running=True, dashboard_connected=True)
+
+    with Session() as session:
+        status = session.get(Status, 1)
+        assert (status.bot_running, status.ws_connected, status.last_heartbeat) == (True, False, 123.0)
+        assert status.dashboard_connected is True
+
+
+def test_runtime_status_forced_flush_is_not_overwritten_by_inflight_timer(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'status.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(engine)
+    timer_entered = threading.Event()
+    release_timer = threading.Event()
+    calls = []
+
+    def session_factory():
+        calls.append(threading.current_thread().name)
+        if len(calls) == 1:
+            # First write is the timer flush: park it mid-flight.
+            timer_entered.set()
+            release_timer.wait(5)
+        return Session()
+
+    writer = RuntimeStatusWriter(session_factory, delay=0.01)
+    writer.update(bot_running=True, ws_connected=True)
+    timer = writer._timer
+    assert timer_entered.wait(5)
+
+    shutdown = threading.Thread(
+        target=writer.update, kwargs={"force": True, "bot_running": False, "ws_connected": False}
+    )
+    shutdown.start()
+    shutdown.join(0.1)
+    release_timer.set()
+    timer.join(5)
+    shutdown.join(5)
+
+    with Session() as session:
+        status = session.get(Status, 1)
+        assert (status.bot_running, status.ws_connected) == (False, False)